@@ -4,6 +4,7 @@ Punto de entrada para el reproductor de música.
 Este módulo inicializa la aplicación PyQt5 y muestra la ventana principal.
 """
 
+import os
 import sys
 from PyQt5.QtWidgets import QApplication
 
@@ -25,7 +26,16 @@ def main():
     window.show()
     
     # Ejecutar el bucle de eventos
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+    
+    # Con FAST_SHUTDOWN=1 se omite la finalización del intérprete, que
+    # destruye uno a uno los objetos de Qt ya liberados por C++
+    if os.environ.get("FAST_SHUTDOWN") == "1":
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
+    
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
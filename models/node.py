@@ -13,15 +13,26 @@ class NodoCancion:
     Cada nodo contiene información sobre una canción (título, artista, duración, ruta)
     y referencias al nodo anterior y siguiente en la lista.
     
+    Los atributos se declaran en __slots__ (en el mismo orden que aquí),
+    por lo que no es posible agregar atributos nuevos a una instancia.
+    La clase no define __eq__: dos nodos solo son iguales si son el mismo
+    objeto, y las comparaciones entre nodos se hacen con ``is``.
+    
     Attributes:
         titulo (str): Título de la canción.
         artista (str): Nombre del artista o grupo.
         duracion (int): Duración de la canción en segundos.
         ruta (str): Ruta completa al archivo de audio.
-        anterior (NodoCancion): Referencia al nodo anterior en la lista.
-        siguiente (NodoCancion): Referencia al nodo siguiente en la lista.
+        anterior (NodoCancion): Referencia al nodo anterior en la lista
+            (None mientras el nodo no pertenece a una lista).
+        siguiente (NodoCancion): Referencia al nodo siguiente en la lista
+            (None mientras el nodo no pertenece a una lista).
     """
     
+    # Atributos fijos: evita el __dict__ por instancia en listas grandes
+    __slots__ = ('titulo', 'artista', 'duracion', 'ruta', 'anterior', 'siguiente',
+                 '_display')
+    
     def __init__(self, titulo, artista, duracion, ruta):
         """
         Inicializa un nuevo nodo con la información de la canción.
@@ -38,21 +49,24 @@ class NodoCancion:
         self.duracion = duracion
         self.ruta = ruta
         
+        # Representación en texto, calculada una sola vez (formato MM:SS)
+        minutos, segundos = divmod(duracion, 60)
+        self._display = f"{titulo} - {artista} ({minutos}:{segundos:02d})"
+        
         # Referencias para la lista doblemente enlazada
-        # Por defecto, los enlaces apuntan a sí mismo (nodo aislado)
-        self.anterior = self
-        self.siguiente = self
+        # Un nodo aislado no tiene enlaces: la lista los establece al insertarlo
+        # (apuntar a sí mismo crearía un ciclo de referencias por cada nodo)
+        self.anterior = None
+        self.siguiente = None
     
     def __str__(self):
         """
         Devuelve una representación en cadena del nodo.
         
+        La cadena se construye en __init__, ya que los datos de la canción
+        no cambian después de crear el nodo.
+        
         Returns:
             str: Representación en formato "Título - Artista (Duración)".
         """
-        # Convertir duración de segundos a formato MM:SS
-        minutos = self.duracion // 60
-        segundos = self.duracion % 60
-        duracion_str = f"{minutos}:{segundos:02d}"
-        
-        return f"{self.titulo} - {self.artista} ({duracion_str})" 
\ No newline at end of file
+        return self._display
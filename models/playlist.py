@@ -16,6 +16,13 @@ class ListaReproduccion:
     de navegación en ambas direcciones (anterior/siguiente) y mantiene una referencia
     a la canción que se está reproduciendo actualmente.
     
+    La lista utiliza un nodo centinela permanente: el primer nodo real es
+    el siguiente del centinela y el último es su anterior. De esta forma,
+    insertar y eliminar no necesitan casos especiales para la lista vacía
+    o con un solo elemento. Internamente, el puntero a la canción actual
+    apunta al centinela cuando la lista está vacía, por lo que nunca es None;
+    la conversión a None se hace solo al devolver un nodo al exterior.
+    
     Attributes:
         actual (NodoCancion): Referencia al nodo que contiene la canción actual.
         primero (NodoCancion): Referencia al primer nodo de la lista (primera canción agregada).
@@ -26,9 +33,40 @@ class ListaReproduccion:
         """
         Inicializa una lista de reproducción vacía.
         """
-        self.actual = None  # No hay canciones en la lista inicialmente
-        self.primero = None # Referencia al primer nodo (orden cronológico)
+        # Nodo centinela: nunca contiene una canción y nunca se elimina
+        self._centinela = NodoCancion("", "", 0, "")
+        self._centinela.anterior = self._centinela
+        self._centinela.siguiente = self._centinela
+        
+        self._actual = self._centinela  # No hay canciones en la lista inicialmente
         self.tamanio = 0    # Contador de canciones
+        
+        # Copia en orden cronológico; se invalida al modificar la estructura
+        self._snapshot = None
+        
+        # Índice ruta -> nodos con esa ruta (un archivo puede agregarse varias veces)
+        self._por_ruta = {}
+    
+    @property
+    def actual(self):
+        """
+        Nodo de la canción actual.
+        
+        Returns:
+            NodoCancion: El nodo actual, o None si la lista está vacía.
+        """
+        return self.obtener_cancion_actual()
+    
+    @property
+    def primero(self):
+        """
+        Primer nodo de la lista (orden cronológico).
+        
+        Returns:
+            NodoCancion: El primer nodo, o None si la lista está vacía.
+        """
+        primero = self._centinela.siguiente
+        return None if primero is self._centinela else primero
     
     def esta_vacia(self):
         """
@@ -37,15 +75,15 @@ class ListaReproduccion:
         Returns:
             bool: True si la lista está vacía, False en caso contrario.
         """
-        return self.tamanio == 0
+        return self._centinela.siguiente is self._centinela
     
     def agregar_cancion(self, titulo, artista, duracion, ruta):
         """
         Agrega una nueva canción a la lista de reproducción.
         
-        La nueva canción se inserta siempre al final de la lista, manteniendo
-        un orden cronológico. Si la lista está vacía, la canción se convierte
-        en la primera y única de la lista.
+        La nueva canción se inserta siempre al final de la lista (justo antes
+        del centinela), manteniendo un orden cronológico. Si la lista estaba
+        vacía, la canción se convierte también en la canción actual.
         
         Args:
             titulo (str): Título de la canción.
@@ -59,29 +97,73 @@ class ListaReproduccion:
         # Crear un nuevo nodo con la información de la canción
         nuevo_nodo = NodoCancion(titulo, artista, duracion, ruta)
         
-        # Caso 1: Lista vacía
-        if self.esta_vacia():
-            # El nodo apunta a sí mismo en ambas direcciones
-            self.actual = nuevo_nodo
-            self.primero = nuevo_nodo  # El primer nodo agregado es también el primero de la lista
-        # Caso 2: Lista con al menos una canción
-        else:
-            # El último nodo es el anterior al primero en una lista circular
-            ultimo_nodo = self.primero.anterior
-            
-            # Insertar el nuevo nodo después del último
-            # 1. Establecer los enlaces del nuevo nodo
-            nuevo_nodo.siguiente = self.primero
-            nuevo_nodo.anterior = ultimo_nodo
-            # 2. Ajustar los enlaces de los nodos adyacentes
-            ultimo_nodo.siguiente = nuevo_nodo
-            self.primero.anterior = nuevo_nodo
+        # El último nodo es el anterior al centinela (el propio centinela si está vacía)
+        centinela = self._centinela
+        ultimo_nodo = centinela.anterior
+        
+        # Insertar el nuevo nodo entre el último y el centinela
+        nuevo_nodo.siguiente = centinela
+        nuevo_nodo.anterior = ultimo_nodo
+        ultimo_nodo.siguiente = nuevo_nodo
+        centinela.anterior = nuevo_nodo
+        
+        # La primera canción agregada pasa a ser la actual
+        if self._actual is centinela:
+            self._actual = nuevo_nodo
+        
+        # Registrar el nodo en el índice por ruta
+        self._por_ruta.setdefault(ruta, []).append(nuevo_nodo)
         
         # Incrementar el contador de canciones
         self.tamanio += 1
+        self._snapshot = None
         
         return nuevo_nodo
     
+    def agregar_canciones(self, canciones):
+        """
+        Agrega varias canciones al final de la lista en una sola operación.
+        
+        Los nodos nuevos se enlazan entre sí y la cadena completa se inserta
+        antes del centinela, actualizando los contadores una sola vez. Si la
+        lista estaba vacía, la primera canción agregada pasa a ser la actual.
+        
+        Args:
+            canciones (iterable): Tuplas (titulo, artista, duracion, ruta).
+            
+        Returns:
+            list: Los nodos recién creados, en el orden en que se agregaron.
+        """
+        # Crear todos los nodos de una vez
+        nodos = [NodoCancion(t, a, d, r) for t, a, d, r in canciones]
+        if not nodos:
+            return nodos
+        
+        # Enlazar los nodos en orden a continuación del último nodo actual
+        centinela = self._centinela
+        por_ruta = self._por_ruta
+        anterior = centinela.anterior
+        for nodo in nodos:
+            nodo.anterior = anterior
+            anterior.siguiente = nodo
+            anterior = nodo
+            por_ruta.setdefault(nodo.ruta, []).append(nodo)
+        
+        # Cerrar la lista circular en el centinela
+        anterior.siguiente = centinela
+        centinela.anterior = anterior
+        
+        if self._actual is centinela:
+            self._actual = nodos[0]
+        
+        self.tamanio += len(nodos)
+        
+        # Los nodos van al final: basta con extender la copia en orden, si existe
+        if self._snapshot is not None:
+            self._snapshot.extend(nodos)
+        
+        return nodos
+    
     def eliminar_cancion_actual(self):
         """
         Elimina la canción actual de la lista de reproducción.
@@ -92,31 +174,36 @@ class ListaReproduccion:
         Returns:
             NodoCancion: El nodo que fue eliminado, o None si la lista está vacía.
         """
-        # Verificar si la lista está vacía
-        if self.esta_vacia():
+        # Guardar referencia al nodo que se va a eliminar
+        nodo_eliminado = self._actual
+        centinela = self._centinela
+        if nodo_eliminado is centinela:
             return None
         
-        # Guardar referencia al nodo que se va a eliminar
-        nodo_eliminado = self.actual
-        
-        # Caso 1: Si es el único nodo en la lista
-        if self.tamanio == 1:
-            self.actual = None
-            self.primero = None
-        # Caso 2: Hay más de un nodo en la lista
-        else:
-            # Si se está eliminando el primer nodo, actualizar primero
-            if self.actual == self.primero:
-                self.primero = self.primero.siguiente
-            
-            # Ajustar los enlaces de los nodos adyacentes para "saltarse" el nodo actual
-            self.actual.anterior.siguiente = self.actual.siguiente
-            self.actual.siguiente.anterior = self.actual.anterior
-            # Mover el puntero actual al siguiente nodo
-            self.actual = self.actual.siguiente
+        # Ajustar los enlaces de los nodos adyacentes para "saltarse" el nodo actual
+        nodo_eliminado.anterior.siguiente = nodo_eliminado.siguiente
+        nodo_eliminado.siguiente.anterior = nodo_eliminado.anterior
+        
+        # Mover el puntero actual al siguiente nodo real (saltando el centinela);
+        # si la lista quedó vacía, el salto vuelve al propio centinela
+        siguiente = nodo_eliminado.siguiente
+        if siguiente is centinela:
+            siguiente = siguiente.siguiente
+        self._actual = siguiente
+        
+        # Desenlazar el nodo eliminado para que no mantenga vivos a sus vecinos
+        nodo_eliminado.anterior = None
+        nodo_eliminado.siguiente = None
+        
+        # Quitar el nodo del índice por ruta
+        nodos = self._por_ruta[nodo_eliminado.ruta]
+        nodos.remove(nodo_eliminado)
+        if not nodos:
+            del self._por_ruta[nodo_eliminado.ruta]
         
         # Decrementar el contador de canciones
         self.tamanio -= 1
+        self._snapshot = None
         
         return nodo_eliminado
     
@@ -127,12 +214,14 @@ class ListaReproduccion:
         Returns:
             NodoCancion: El nodo de la siguiente canción, o None si la lista está vacía.
         """
-        if self.esta_vacia():
-            return None
-        
-        # Mover el puntero actual al siguiente nodo
-        self.actual = self.actual.siguiente
-        return self.actual
+        # Mover el puntero actual al siguiente nodo, saltando el centinela
+        # (con la lista vacía, el centinela se enlaza consigo mismo)
+        centinela = self._centinela
+        siguiente = self._actual.siguiente
+        if siguiente is centinela:
+            siguiente = siguiente.siguiente
+        self._actual = siguiente
+        return None if siguiente is centinela else siguiente
     
     def cancion_anterior(self):
         """
@@ -141,12 +230,14 @@ class ListaReproduccion:
         Returns:
             NodoCancion: El nodo de la canción anterior, o None si la lista está vacía.
         """
-        if self.esta_vacia():
-            return None
-        
-        # Mover el puntero actual al nodo anterior
-        self.actual = self.actual.anterior
-        return self.actual
+        # Mover el puntero actual al nodo anterior, saltando el centinela
+        # (con la lista vacía, el centinela se enlaza consigo mismo)
+        centinela = self._centinela
+        anterior = self._actual.anterior
+        if anterior is centinela:
+            anterior = anterior.anterior
+        self._actual = anterior
+        return None if anterior is centinela else anterior
     
     def obtener_cancion_actual(self):
         """
@@ -155,38 +246,151 @@ class ListaReproduccion:
         Returns:
             NodoCancion: El nodo de la canción actual, o None si la lista está vacía.
         """
-        return self.actual
+        actual = self._actual
+        return None if actual is self._centinela else actual
+    
+    def set_cancion_actual(self, nodo):
+        """
+        Establece directamente la canción actual, sin recorrer la lista.
+        
+        Args:
+            nodo (NodoCancion): Nodo de esta lista que pasa a ser el actual.
+            
+        Returns:
+            bool: True si se estableció, False si el nodo es None o no está
+                enlazado en una lista (por ejemplo, porque ya fue eliminado).
+        """
+        if nodo is None or nodo.siguiente is None or nodo is self._centinela:
+            return False
+        
+        self._actual = nodo
+        return True
+    
+    def buscar_por_ruta(self, ruta):
+        """
+        Busca una canción por la ruta de su archivo.
+        
+        Args:
+            ruta (str): Ruta completa al archivo de audio.
+            
+        Returns:
+            NodoCancion: El primer nodo agregado con esa ruta, o None si no existe.
+        """
+        nodos = self._por_ruta.get(ruta)
+        return nodos[0] if nodos else None
+    
+    def obtener_siguiente_cancion(self):
+        """
+        Obtiene la canción que sigue a la actual sin mover el puntero actual.
+        
+        Returns:
+            NodoCancion: El nodo de la siguiente canción, o None si la lista está vacía.
+        """
+        centinela = self._centinela
+        siguiente = self._actual.siguiente
+        if siguiente is centinela:
+            siguiente = siguiente.siguiente
+        return None if siguiente is centinela else siguiente
+    
+    def obtener_anterior_cancion(self):
+        """
+        Obtiene la canción anterior a la actual sin mover el puntero actual.
+        
+        Returns:
+            NodoCancion: El nodo de la canción anterior, o None si la lista está vacía.
+        """
+        centinela = self._centinela
+        anterior = self._actual.anterior
+        if anterior is centinela:
+            anterior = anterior.anterior
+        return None if anterior is centinela else anterior
     
     def obtener_todas_las_canciones(self):
         """
         Obtiene todas las canciones de la lista de reproducción en orden cronológico.
         
+        El recorrido de la lista se guarda y solo se repite después de agregar
+        o eliminar canciones.
+        
         Returns:
             list: Lista de objetos NodoCancion en el orden en que fueron agregados.
+                Es una copia, por lo que el llamador puede modificarla.
         """
-        if self.esta_vacia():
-            return []
+        if self._snapshot is None:
+            self._snapshot = self._recorrer()
         
+        return list(self._snapshot)
+    
+    def _recorrer(self):
+        """
+        Recorre la lista enlazada desde el primer nodo hasta volver al centinela.
+        
+        Returns:
+            list: Lista de objetos NodoCancion en orden cronológico.
+        """
         # Lista para almacenar todos los nodos
         canciones = []
         
-        # Empezar por el primer nodo (para mantener el orden cronológico)
-        nodo = self.primero
-        
-        # Recorrer la lista circular hasta volver al nodo de inicio
-        # Añadir el primer nodo
-        canciones.append(nodo)
+        # Enlazar a variables locales lo que se consulta en cada vuelta
+        append = canciones.append
+        centinela = self._centinela
         
-        # Moverse al siguiente nodo
-        nodo = nodo.siguiente
-        
-        # Continuar recorriendo mientras no volvamos al nodo inicial
-        while nodo != self.primero:
-            canciones.append(nodo)
+        # Recorrer desde el primer nodo real hasta volver al centinela
+        # (para mantener el orden cronológico)
+        nodo = centinela.siguiente
+        while nodo is not centinela:
+            append(nodo)
             nodo = nodo.siguiente
         
         return canciones
     
+    def a_columnas(self):
+        """
+        Exporta la lista en columnas (una lista por atributo, struct-of-arrays).
+        
+        Este formato es más compacto al serializar (por ejemplo, las duraciones
+        quedan como un solo arreglo de enteros) que una lista de registros.
+        
+        Returns:
+            dict: Diccionario con las claves "titulo", "artista", "duracion" y
+                "ruta", cada una con una lista en orden cronológico.
+        """
+        if self._snapshot is None:
+            self._snapshot = self._recorrer()
+        canciones = self._snapshot
+        
+        return {
+            "titulo": [c.titulo for c in canciones],
+            "artista": [c.artista for c in canciones],
+            "duracion": [c.duracion for c in canciones],
+            "ruta": [c.ruta for c in canciones],
+        }
+    
+    @classmethod
+    def desde_columnas(cls, columnas):
+        """
+        Crea una lista de reproducción a partir de columnas.
+        
+        Es la operación inversa de a_columnas(). La primera canción queda
+        como canción actual.
+        
+        Args:
+            columnas (dict): Diccionario con las claves "titulo", "artista",
+                "duracion" y "ruta", cada una con una lista del mismo largo.
+                
+        Returns:
+            ListaReproduccion: Nueva lista con las canciones en el orden dado.
+        """
+        lista = cls()
+        nodos = lista.agregar_canciones(zip(
+            columnas["titulo"], columnas["artista"],
+            columnas["duracion"], columnas["ruta"]))
+        
+        # La lista estaba vacía: los nodos nuevos son todo su contenido
+        lista._snapshot = list(nodos)
+        
+        return lista
+    
     def __len__(self):
         """
         Devuelve el número de canciones en la lista de reproducción.
@@ -5,6 +5,24 @@ Este paquete proporciona las clases necesarias para controlar la reproducción
 de archivos de audio utilizando PyQt5.
 """
 
-from player.audio_player import AudioPlayer
-
 __all__ = ['AudioPlayer']
+
+
+def __getattr__(name):
+    """
+    Resuelve AudioPlayer solo cuando se accede a él (PEP 562).
+    
+    Así, importar otros módulos del paquete (por ejemplo metadata_cache)
+    no carga el reproductor de audio.
+    
+    Args:
+        name (str): Nombre del atributo solicitado.
+        
+    Returns:
+        object: El atributo solicitado.
+    """
+    if name == 'AudioPlayer':
+        from player.audio_player import AudioPlayer
+        return AudioPlayer
+    
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
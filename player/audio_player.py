@@ -2,11 +2,13 @@
 Módulo que implementa la reproducción de audio utilizando PyQt5.
 
 Este módulo contiene la clase AudioPlayer, que utiliza QMediaPlayer de PyQt5
-para reproducir archivos de audio y controlar la reproducción.
+para reproducir archivos de audio y controlar la reproducción. QtMultimedia
+se importa al crear el primer AudioPlayer, no al importar este módulo.
 """
 
-from PyQt5.QtCore import QUrl, pyqtSignal, QObject
-from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
+from collections import OrderedDict
+
+from PyQt5.QtCore import QUrl, QTimer, pyqtSignal, QObject
 
 
 class AudioPlayer(QObject):
@@ -28,14 +30,22 @@ class AudioPlayer(QObject):
         stateChanged: Emitido cuando cambia el estado de reproducción.
         mediaStatusChanged: Emitido cuando cambia el estado del medio.
         playbackCompleted: Emitido cuando finaliza la reproducción de una canción.
+        prefetchRequested: Emitido después de cargar una canción, para que el
+            propietario indique con prefetch() cuál es la siguiente.
+    
+    Las cuatro primeras señales son las propias de media_player, expuestas
+    directamente para no reenviar cada emisión desde Python.
     """
     
     # Definición de señales personalizadas
-    positionChanged = pyqtSignal(int)         # Posición actual en milisegundos
-    durationChanged = pyqtSignal(int)         # Duración total en milisegundos
-    stateChanged = pyqtSignal(int)            # Estado de reproducción
-    mediaStatusChanged = pyqtSignal(int)      # Estado del medio
     playbackCompleted = pyqtSignal()          # Finalización de reproducción
+    prefetchRequested = pyqtSignal()          # Preparar la siguiente canción
+    
+    # Intervalo entre notificaciones de posición (la interfaz muestra segundos)
+    NOTIFY_INTERVAL_MS = 1000
+    
+    # Número de contenidos multimedia recientes que se conservan
+    CONTENT_CACHE_SIZE = 8
     
     def __init__(self):
         """
@@ -43,14 +53,26 @@ class AudioPlayer(QObject):
         """
         super().__init__()
         
+        # Importar QtMultimedia solo al crear el reproductor: cargar sus
+        # bibliotecas nativas es costoso y no hace falta para importar el módulo
+        from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
+        self._media_content_class = QMediaContent
+        
         # Crear el reproductor multimedia
         self.media_player = QMediaPlayer()
+        self.media_player.setNotifyInterval(self.NOTIFY_INTERVAL_MS)
         self.current_file = ""
         
-        # Conectar señales del reproductor a métodos de manejo
-        self.media_player.positionChanged.connect(self._on_position_changed)
-        self.media_player.durationChanged.connect(self._on_duration_changed)
-        self.media_player.stateChanged.connect(self._on_state_changed)
+        # Contenidos multimedia recientes (ruta -> QMediaContent), en orden LRU
+        self._content_cache = OrderedDict()
+        
+        # Exponer directamente las señales del reproductor (sin reenvío)
+        self.positionChanged = self.media_player.positionChanged          # Posición en ms
+        self.durationChanged = self.media_player.durationChanged          # Duración en ms
+        self.stateChanged = self.media_player.stateChanged                # Estado de reproducción
+        self.mediaStatusChanged = self.media_player.mediaStatusChanged    # Estado del medio
+        
+        # Solo el estado del medio necesita un manejador, para detectar el final
         self.media_player.mediaStatusChanged.connect(self._on_media_status_changed)
     
     def load(self, file_path):
@@ -60,13 +82,51 @@ class AudioPlayer(QObject):
         Args:
             file_path (str): Ruta al archivo de audio.
         """
-        # Convertir la ruta del archivo a QUrl
-        url = QUrl.fromLocalFile(file_path)
-        
-        # Crear contenido multimedia y establecerlo en el reproductor
-        content = QMediaContent(url)
-        self.media_player.setMedia(content)
+        # Establecer el contenido en el reproductor
+        self.media_player.setMedia(self._get_content(file_path))
         self.current_file = file_path
+        
+        # Pedir la siguiente canción en el próximo ciclo de eventos, cuando
+        # el propietario ya haya actualizado la canción actual
+        QTimer.singleShot(0, self.prefetchRequested.emit)
+    
+    def prefetch(self, file_path):
+        """
+        Prepara por adelantado el contenido de la siguiente canción.
+        
+        El contenido queda en la caché de contenidos recientes, de modo que
+        la siguiente llamada a load() con la misma ruta lo reutiliza.
+        
+        Args:
+            file_path (str): Ruta al archivo de audio de la siguiente canción.
+        """
+        self._get_content(file_path)
+    
+    def _get_content(self, file_path):
+        """
+        Obtiene el contenido multimedia de un archivo, reutilizando los recientes.
+        
+        Args:
+            file_path (str): Ruta al archivo de audio.
+            
+        Returns:
+            QMediaContent: Contenido multimedia para el archivo.
+        """
+        cache = self._content_cache
+        content = cache.get(file_path)
+        
+        if content is None:
+            # Convertir la ruta del archivo a QUrl y crear el contenido
+            content = self._media_content_class(QUrl.fromLocalFile(file_path))
+            cache[file_path] = content
+            
+            # Descartar el contenido usado hace más tiempo
+            if len(cache) > self.CONTENT_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(file_path)
+        
+        return content
     
     def play(self):
         """
@@ -138,7 +198,7 @@ class AudioPlayer(QObject):
         Returns:
             bool: True si está reproduciendo, False en caso contrario.
         """
-        return self.media_player.state() == QMediaPlayer.PlayingState
+        return self.media_player.state() == self.media_player.PlayingState
     
     def is_paused(self):
         """
@@ -147,37 +207,7 @@ class AudioPlayer(QObject):
         Returns:
             bool: True si está en pausa, False en caso contrario.
         """
-        return self.media_player.state() == QMediaPlayer.PausedState
-    
-    def _on_position_changed(self, position):
-        """
-        Manejador para cambios en la posición de reproducción.
-        
-        Args:
-            position (int): Posición actual en milisegundos.
-        """
-        # Reenviar la señal a los observadores
-        self.positionChanged.emit(position)
-    
-    def _on_duration_changed(self, duration):
-        """
-        Manejador para cambios en la duración del medio.
-        
-        Args:
-            duration (int): Duración en milisegundos.
-        """
-        # Reenviar la señal a los observadores
-        self.durationChanged.emit(duration)
-    
-    def _on_state_changed(self, state):
-        """
-        Manejador para cambios en el estado de reproducción.
-        
-        Args:
-            state (QMediaPlayer.State): Nuevo estado del reproductor.
-        """
-        # Reenviar la señal a los observadores
-        self.stateChanged.emit(state)
+        return self.media_player.state() == self.media_player.PausedState
     
     def _on_media_status_changed(self, status):
         """
@@ -186,9 +216,6 @@ class AudioPlayer(QObject):
         Args:
             status (QMediaPlayer.MediaStatus): Nuevo estado del medio.
         """
-        # Reenviar la señal a los observadores
-        self.mediaStatusChanged.emit(status)
-        
         # Emitir señal cuando el medio ha llegado al final
-        if status == QMediaPlayer.EndOfMedia:
+        if status == self.media_player.EndOfMedia:
             self.playbackCompleted.emit() 
\ No newline at end of file
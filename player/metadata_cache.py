@@ -0,0 +1,268 @@
+"""
+Módulo que implementa una caché en disco de los metadatos de audio.
+
+Este módulo guarda en una base de datos SQLite el título, el artista y la
+duración extraídos de cada archivo de audio, de modo que al volver a agregar
+el mismo archivo no sea necesario leer de nuevo sus cabeceras. Cada entrada
+se valida con la fecha de modificación y el tamaño del archivo (os.stat),
+por lo que un archivo modificado se vuelve a leer automáticamente.
+
+La caché JSON de versiones anteriores (metadata.json, en la misma carpeta)
+se importa a la base de datos la primera vez que se abre y después se borra.
+
+Las funciones pueden llamarse desde varios hilos a la vez.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+
+
+# Ubicación del archivo de caché
+CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "reproductor",
+                          "metadata.db")
+
+# Caché JSON usada por versiones anteriores, importada al crear la base de datos
+LEGACY_CACHE_FILE = os.path.join(os.path.dirname(CACHE_FILE), "metadata.json")
+
+_log = logging.getLogger(__name__)
+
+# Tabla con una fila por archivo de audio
+_SCHEMA = ("CREATE TABLE IF NOT EXISTS metadatos ("
+           "ruta TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, "
+           "titulo TEXT, artista TEXT, duracion INTEGER)")
+
+# Estado de la base de datos: None si aún no se abrió, True si está disponible
+# y False si no se pudo abrir (no se vuelve a intentar en este proceso)
+_db_ready = None
+
+# Protege la creación de la base de datos
+_init_lock = threading.Lock()
+
+# Conexión de cada hilo a la base de datos; SQLite atiende las lecturas
+# de varias conexiones a la vez, así que las consultas no usan _lock
+_local = threading.local()
+
+# Entradas guardadas y aún no escritas en disco:
+# ruta -> (mtime, size, titulo, artista, duracion)
+_pending = {}
+
+# Protege _pending frente a accesos desde varios hilos
+_lock = threading.Lock()
+
+
+def _init_db():
+    """
+    Crea la base de datos e importa la caché JSON anterior, una vez por proceso.
+    
+    Si la base de datos no se puede abrir, el error se registra una sola vez
+    y la caché queda desactivada durante el resto de la ejecución.
+    
+    Returns:
+        bool: True si la base de datos está disponible.
+    """
+    global _db_ready
+    
+    with _init_lock:
+        if _db_ready is None:
+            try:
+                os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+                conn = sqlite3.connect(CACHE_FILE)
+                try:
+                    with conn:
+                        conn.execute(_SCHEMA)
+                        migrada = _import_legacy(conn)
+                finally:
+                    conn.close()
+                
+                _db_ready = True
+            except (OSError, sqlite3.Error) as e:
+                _log.error("No se pudo abrir la caché de metadatos %s: %s",
+                           CACHE_FILE, e)
+                _db_ready = False
+                return _db_ready
+            
+            # Borrar la caché anterior solo cuando ya está en la base de datos
+            if migrada:
+                try:
+                    os.remove(LEGACY_CACHE_FILE)
+                except OSError as e:
+                    _log.warning("No se pudo borrar la caché anterior %s: %s",
+                                 LEGACY_CACHE_FILE, e)
+    
+    return _db_ready
+
+
+def _import_legacy(conn):
+    """
+    Copia en la base de datos las entradas de la caché JSON anterior.
+    
+    Las entradas dañadas se descartan; las rutas que ya están en la base
+    de datos no se modifican.
+    
+    Args:
+        conn (sqlite3.Connection): Conexión con la tabla de metadatos creada.
+    
+    Returns:
+        bool: True si existía el archivo de la caché anterior.
+    """
+    try:
+        with open(LEGACY_CACHE_FILE, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+    except FileNotFoundError:
+        return False
+    except (OSError, ValueError):
+        # Archivo dañado: no hay nada que importar
+        return True
+    
+    if not isinstance(entries, dict):
+        return True
+    
+    rows = []
+    for ruta, entry in entries.items():
+        try:
+            meta = entry["meta"]
+            rows.append((ruta, entry["mtime"], entry["size"], meta["titulo"],
+                         meta["artista"], meta["duracion"]))
+        except (KeyError, TypeError):
+            continue
+    
+    conn.executemany(
+        "INSERT OR IGNORE INTO metadatos "
+        "(ruta, mtime, size, titulo, artista, duracion) "
+        "VALUES (?, ?, ?, ?, ?, ?)", rows)
+    return True
+
+
+def _get_conn():
+    """
+    Obtiene la conexión del hilo actual, abriéndola la primera vez.
+    
+    Returns:
+        sqlite3.Connection: Conexión a la base de datos, o None si la
+            caché no está disponible.
+        
+    Raises:
+        sqlite3.Error: Si no se puede abrir la conexión del hilo.
+    """
+    if not (_db_ready or _init_db()):
+        return None
+    
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(CACHE_FILE)
+        _local.conn = conn
+    
+    return conn
+
+
+def _stat_key(path):
+    """
+    Obtiene la clave de validación de un archivo.
+    
+    Args:
+        path (str): Ruta al archivo de audio.
+    
+    Returns:
+        tuple: (mtime, size) del archivo, o None si no se puede consultar.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    
+    return st.st_mtime_ns, st.st_size
+
+
+def load(path):
+    """
+    Obtiene los metadatos guardados de un archivo de audio.
+    
+    Args:
+        path (str): Ruta al archivo de audio.
+    
+    Returns:
+        dict: Metadatos con las claves "titulo", "artista" y "duracion",
+            o None si no están en caché o el archivo cambió.
+    """
+    key = _stat_key(path)
+    if key is None:
+        return None
+    
+    mtime, size = key
+    with _lock:
+        entry = _pending.get(path)
+    
+    if entry is not None:
+        row = entry[2:] if entry[:2] == key else None
+    else:
+        # Consulta fuera de _lock, con la conexión propia del hilo
+        row = None
+        try:
+            conn = _get_conn()
+            if conn is not None:
+                row = conn.execute(
+                    "SELECT titulo, artista, duracion FROM metadatos "
+                    "WHERE ruta = ? AND mtime = ? AND size = ?",
+                    (path, mtime, size)).fetchone()
+        except sqlite3.Error:
+            # Sin acceso a la caché: leer las etiquetas del archivo
+            pass
+    
+    if row is None:
+        return None
+    
+    titulo, artista, duracion = row
+    return {"titulo": titulo, "artista": artista, "duracion": duracion}
+
+
+def save(path, meta):
+    """
+    Guarda en la caché los metadatos de un archivo de audio.
+    
+    Los cambios se mantienen en memoria hasta llamar a flush().
+    
+    Args:
+        path (str): Ruta al archivo de audio.
+        meta (dict): Metadatos con las claves "titulo", "artista" y "duracion".
+    """
+    key = _stat_key(path)
+    if key is None:
+        return
+    
+    mtime, size = key
+    with _lock:
+        _pending[path] = (mtime, size, meta["titulo"], meta["artista"],
+                          meta["duracion"])
+
+
+def flush():
+    """
+    Escribe en disco los cambios pendientes de la caché.
+    
+    Todas las entradas pendientes se escriben en una sola transacción.
+    Si no se pueden escribir, se conservan en memoria para el próximo intento.
+    """
+    with _lock:
+        if not _pending:
+            return
+        
+        try:
+            conn = _get_conn()
+            if conn is None:
+                # Caché no disponible (el error ya se registró al abrirla)
+                return
+            
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO metadatos "
+                    "(ruta, mtime, size, titulo, artista, duracion) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(ruta,) + entry for ruta, entry in _pending.items()])
+        except sqlite3.Error as e:
+            _log.error("Error al guardar la caché de metadatos: %s", e)
+            return
+        
+        _pending.clear()
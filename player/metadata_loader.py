@@ -0,0 +1,196 @@
+"""
+Módulo que implementa la lectura de metadatos de audio en segundo plano.
+
+Este módulo contiene la función read_metadata, que obtiene el título, el
+artista y la duración de un archivo de audio, y la tarea MetadataTask, que
+lee los metadatos de varios archivos en un hilo de QThreadPool y entrega
+los resultados por lotes mediante señales, sin bloquear la interfaz.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import mutagen
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from player import metadata_cache
+
+
+# Número de archivos que se entregan en cada lote
+BATCH_SIZE = 64
+
+# Número de archivos del primer lote, menor para que las primeras filas
+# aparezcan en la tabla casi de inmediato
+FIRST_BATCH_SIZE = 8
+
+# Número máximo de archivos que se leen a la vez dentro de una tarea
+MAX_WORKERS = 8
+
+# Extensiones (en minúsculas) de los archivos cuyas etiquetas se leen
+SUPPORTED_AUDIO_EXT = frozenset({'.mp3', '.wav', '.ogg'})
+
+
+def read_metadata(file_path):
+    """
+    Obtiene los metadatos de un archivo de audio.
+    
+    Consulta primero la caché de metadatos; si no hay una entrada válida,
+    lee las etiquetas del archivo y guarda el resultado en la caché.
+    Puede llamarse desde cualquier hilo.
+    
+    Args:
+        file_path (str): Ruta al archivo de audio.
+    
+    Returns:
+        tuple: (titulo, artista, duracion) de la canción.
+    """
+    # Usar los metadatos guardados si el archivo no ha cambiado
+    meta = metadata_cache.load(file_path)
+    if meta is not None:
+        return meta["titulo"], meta["artista"], meta["duracion"]
+    
+    # Obtener el nombre del archivo sin extensión como título
+    base_name = os.path.basename(file_path)
+    title, ext = os.path.splitext(base_name)
+    
+    # Intentar extraer metadatos si es un formato de audio soportado
+    artist = "Desconocido"
+    duration = 0
+    
+    if ext.lower() in SUPPORTED_AUDIO_EXT:
+        try:
+            # easy=True expone las etiquetas con nombres comunes ("artist",
+            # "title") en lugar de los marcos ID3 (TPE1, TIT2)
+            audio = mutagen.File(file_path, easy=True)
+            if audio is None:
+                return title, artist, duration
+            
+            duration = int(audio.info.length)
+            
+            # Intentar obtener metadatos
+            artistas = audio.get('artist')
+            if artistas and artistas[0]:
+                artist = artistas[0]
+            titulos = audio.get('title')
+            if titulos and titulos[0]:
+                title = titulos[0]
+            
+            metadata_cache.save(file_path, {
+                "titulo": title,
+                "artista": artist,
+                "duracion": duration,
+            })
+        except Exception as e:
+            print(f"Error al leer metadatos de audio: {e}")
+    
+    return title, artist, duration
+
+
+class MetadataSignals(QObject):
+    """
+    Objeto que transporta las señales de MetadataTask al hilo de la interfaz.
+    
+    QRunnable no es un QObject y no puede emitir señales, así que la tarea
+    emite a través de este objeto, creado en el hilo de la interfaz. Debe
+    crearse sin padre: así no se destruye junto con el widget mientras una
+    tarea que guarda una referencia a él sigue en ejecución.
+    
+    Signals:
+        batchReady: Emitido con una lista de tuplas (titulo, artista, duracion, ruta).
+        finished: Emitido cuando la tarea terminó de procesar todos los archivos.
+    """
+    
+    # Definición de señales
+    batchReady = pyqtSignal(list)   # Lote de canciones leídas
+    finished = pyqtSignal()         # Fin de la tarea
+
+
+class MetadataTask(QRunnable):
+    """
+    Tarea que lee los metadatos de varios archivos en un hilo secundario.
+    
+    Hasta MAX_WORKERS archivos se leen a la vez, para que la espera del disco
+    de uno se solape con la de los demás. Los resultados se entregan en el
+    orden de las rutas recibidas: un primer lote de FIRST_BATCH_SIZE y
+    después lotes de BATCH_SIZE. La tarea puede cancelarse con cancel();
+    la cancelación se comprueba entre lotes y, una vez cancelada, la tarea
+    no emite más señales.
+    
+    Attributes:
+        paths (list): Rutas de los archivos de audio a procesar.
+        signals (MetadataSignals): Objeto a través del cual se emiten los resultados.
+    """
+    
+    def __init__(self, paths, signals):
+        """
+        Inicializa la tarea.
+        
+        Args:
+            paths (list): Rutas de los archivos de audio a procesar.
+            signals (MetadataSignals): Objeto a través del cual se emiten los resultados.
+        """
+        super().__init__()
+        self.paths = list(paths)
+        self.signals = signals
+        self._cancelled = threading.Event()
+    
+    def cancel(self):
+        """
+        Pide a la tarea que se detenga al terminar el lote en curso.
+        
+        Puede llamarse desde cualquier hilo.
+        """
+        self._cancelled.set()
+    
+    def run(self):
+        """
+        Lee los metadatos de todos los archivos y emite los lotes.
+        """
+        inicio = 0
+        limite = FIRST_BATCH_SIZE
+        
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            while inicio < len(self.paths):
+                if self._cancelled.is_set():
+                    return
+                
+                # Leer un lote; map() devuelve los resultados en el orden de
+                # las rutas y solo se envían las rutas de este lote, de modo
+                # que al cancelar no quedan lecturas pendientes
+                rutas = self.paths[inicio:inicio + limite]
+                batch = [(title, artist, duration, file_path)
+                         for file_path, (title, artist, duration)
+                         in zip(rutas, executor.map(read_metadata, rutas))]
+                
+                if not self._emit('batchReady', batch):
+                    return
+                
+                inicio += limite
+                limite = BATCH_SIZE
+        
+        self._emit('finished')
+    
+    def _emit(self, name, *args):
+        """
+        Emite una señal salvo que la tarea se haya cancelado.
+        
+        Args:
+            name (str): Nombre de la señal de self.signals a emitir.
+            *args: Argumentos de la señal.
+            
+        Returns:
+            bool: True si se emitió la señal, False si la tarea se canceló
+                o el objeto de señales ya no existe.
+        """
+        if self._cancelled.is_set():
+            return False
+        
+        try:
+            getattr(self.signals, name).emit(*args)
+        except RuntimeError:
+            # El objeto de señales fue destruido: no hay a quién entregar
+            self._cancelled.set()
+            return False
+        
+        return True
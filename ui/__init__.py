@@ -5,8 +5,33 @@ Este paquete proporciona las clases necesarias para la interfaz gráfica
 utilizando PyQt5.
 """
 
-from ui.main_window import MainWindow
-from ui.player_widget import PlayerWidget
-from ui.playlist_widget import PlaylistWidget
+import importlib
 
 __all__ = ['MainWindow', 'PlayerWidget', 'PlaylistWidget']
+
+# Módulo que define cada clase exportada
+_MODULOS = {
+    'MainWindow': 'ui.main_window',
+    'PlayerWidget': 'ui.player_widget',
+    'PlaylistWidget': 'ui.playlist_widget',
+}
+
+
+def __getattr__(name):
+    """
+    Resuelve las clases del paquete solo cuando se accede a ellas (PEP 562).
+    
+    Así, importar ui.main_window no carga los widgets del reproductor y de
+    la lista de reproducción hasta que la ventana los crea.
+    
+    Args:
+        name (str): Nombre del atributo solicitado.
+        
+    Returns:
+        object: El atributo solicitado.
+    """
+    modulo = _MODULOS.get(name)
+    if modulo is not None:
+        return getattr(importlib.import_module(modulo), name)
+    
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
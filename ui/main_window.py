@@ -5,14 +5,153 @@ Este módulo contiene la implementación de la ventana principal que
 integra todos los componentes de la interfaz gráfica.
 """
 
-from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-                           QSplitter, QAction, QMenu, QApplication, QStyle,
-                           QMessageBox, QFileDialog, QLabel, QStatusBar)
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QAction,
+                           QApplication, QStyle, QMessageBox, QLabel, QStatusBar)
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QIcon, QPalette, QColor
 
-from ui.player_widget import PlayerWidget
-from ui.playlist_widget import PlaylistWidget
+
+# Hoja de estilo del tema oscuro, aplicada a toda la aplicación
+_DARK_QSS_APP = """
+    QMainWindow {
+        background-color: #353535;
+    }
+    QLabel {
+        color: #FFFFFF;
+    }
+    QPushButton {
+        background-color: #5A5A5A;
+        color: #FFFFFF;
+        border: 1px solid #5A5A5A;
+        padding: 5px;
+        border-radius: 3px;
+    }
+    QPushButton:hover {
+        background-color: #6A6A6A;
+    }
+    QPushButton:pressed {
+        background-color: #7A7A7A;
+    }
+    QSlider::groove:horizontal {
+        border: 1px solid #999999;
+        height: 8px;
+        background: #4A4A4A;
+        margin: 2px 0;
+        border-radius: 4px;
+    }
+    QSlider::handle:horizontal {
+        background: #2A82DA;
+        border: 1px solid #2A82DA;
+        width: 18px;
+        margin: -2px 0;
+        border-radius: 3px;
+    }
+    QTableView {
+        background-color: #252525;
+        alternate-background-color: #2D2D2D;
+        color: #FFFFFF;
+        gridline-color: #353535;
+    }
+    QHeaderView::section {
+        background-color: #3F3F3F;
+        color: #FFFFFF;
+        padding: 4px;
+        border: 1px solid #5F5F5F;
+    }
+    QMenuBar {
+        background-color: #353535;
+        color: #FFFFFF;
+    }
+    QMenuBar::item {
+        background-color: transparent;
+    }
+    QMenuBar::item:selected {
+        background-color: #454545;
+    }
+    QMenu {
+        background-color: #353535;
+        color: #FFFFFF;
+        border: 1px solid #5A5A5A;
+    }
+    QMenu::item:selected {
+        background-color: #454545;
+    }
+    QStatusBar {
+        background-color: #252525;
+        color: #FFFFFF;
+    }
+"""
+
+# Texto con formato HTML del diálogo Acerca de
+_ABOUT_HTML = """<h2 style="color: #333333; text-align: center;">Reproductor de Música</h2>
+<p style="color: #333333; text-align: center;"><b>Versión 1.0</b></p>
+<hr>
+<p style="color: #333333;">Un reproductor de música desarrollado con PyQt5 que utiliza una 
+lista doblemente enlazada circular para gestionar la lista de reproducción.</p>
+
+<p style="color: #333333;"><b>Características principales:</b></p>
+<ul style="color: #333333;">
+    <li>Reproducción de archivos MP3, WAV y OGG</li>
+    <li>Gestión de lista de reproducción (agregar/eliminar canciones)</li>
+    <li>Controles de reproducción (reproducir, pausar, detener)</li>
+    <li>Navegación entre canciones (anterior/siguiente)</li>
+    <li>Extracción automática de metadatos</li>
+    <li>Interfaz gráfica moderna con tema oscuro</li>
+</ul>
+
+<p style="color: #333333;"><b>Desarrollado para:</b><br>
+Estructura de Datos I<br>
+Universidad Rafael Landívar<br>
+2025</p>
+
+<p style="color: #333333;"><b>Desarrollado por:</b><br>
+Jordin García</p>"""
+
+
+# Paleta del tema oscuro, creada en el primer uso
+_DARK_PALETTE = None
+
+
+def _get_dark_palette():
+    """
+    Obtiene la paleta del tema oscuro, creándola la primera vez.
+    
+    La paleta se crea en el primer uso y no al importar el módulo, porque
+    los objetos de Qt GUI requieren que ya exista una QApplication.
+    
+    Returns:
+        QPalette: Paleta del tema oscuro.
+    """
+    global _DARK_PALETTE
+    
+    if _DARK_PALETTE is None:
+        # Definir una paleta oscura
+        palette = QPalette()
+        
+        # Colores de fondo
+        palette.setColor(QPalette.Window, QColor(53, 53, 53))
+        palette.setColor(QPalette.WindowText, Qt.white)
+        palette.setColor(QPalette.Base, QColor(25, 25, 25))
+        palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
+        palette.setColor(QPalette.ToolTipBase, Qt.white)
+        palette.setColor(QPalette.ToolTipText, Qt.white)
+        
+        # Colores de texto
+        palette.setColor(QPalette.Text, Qt.white)
+        palette.setColor(QPalette.Button, QColor(53, 53, 53))
+        palette.setColor(QPalette.ButtonText, Qt.white)
+        
+        # Colores de selección
+        palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
+        palette.setColor(QPalette.HighlightedText, Qt.black)
+        
+        # Roles deshabilitados
+        palette.setColor(QPalette.Disabled, QPalette.Text, Qt.darkGray)
+        palette.setColor(QPalette.Disabled, QPalette.ButtonText, Qt.darkGray)
+        
+        _DARK_PALETTE = palette
+    
+    return _DARK_PALETTE
 
 
 class MainWindow(QMainWindow):
@@ -40,8 +179,25 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Reproductor de Música")
         self.setMinimumSize(800, 600)
         
+        # Obtener una sola vez los iconos estándar que se reutilizan
+        style = self.style()
+        self._icon_play = style.standardIcon(QStyle.SP_MediaPlay)
+        self._icon_pause = style.standardIcon(QStyle.SP_MediaPause)
+        self._icon_stop = style.standardIcon(QStyle.SP_MediaStop)
+        self._icon_prev = style.standardIcon(QStyle.SP_MediaSkipBackward)
+        self._icon_next = style.standardIcon(QStyle.SP_MediaSkipForward)
+        
         # Configurar el icono de la aplicación
-        self.setWindowIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
+        self.setWindowIcon(self._icon_play)
+        
+        # Indica si ya hay una canción cargada en el reproductor
+        self._has_song = False
+        
+        # Indica si ya hay un avance pendiente tras terminar una canción
+        self._advance_pending = False
+        
+        # Diálogo Acerca de, creado la primera vez que se muestra
+        self._about_box = None
         
         # Configurar la interfaz de usuario
         self._setup_ui()
@@ -68,7 +224,11 @@ class MainWindow(QMainWindow):
         main_layout.setContentsMargins(0, 0, 0, 0)  # Eliminar márgenes
         main_layout.setSpacing(0)  # Eliminar espaciado entre widgets
         
-        # Crear widgets
+        # Crear widgets (importados aquí para que importar este módulo no
+        # cargue los módulos de reproducción y de lectura de metadatos)
+        from ui.player_widget import PlayerWidget
+        from ui.playlist_widget import PlaylistWidget
+        
         self.player_widget = PlayerWidget()
         self.playlist_widget = PlaylistWidget()
         
@@ -87,68 +247,59 @@ class MainWindow(QMainWindow):
         """
         Configura los menús de la aplicación.
         """
-        # Menú Archivo
-        file_menu = self.menuBar().addMenu("&Archivo")
-        
-        # Acción Abrir
-        open_action = QAction(QIcon.fromTheme("document-open"), "&Abrir...", self)
-        open_action.setShortcut("Ctrl+O")
-        open_action.setStatusTip("Abrir archivos de audio")
-        open_action.triggered.connect(self._on_open_action)
-        file_menu.addAction(open_action)
-        
-        # Separador
-        file_menu.addSeparator()
-        
-        # Acción Salir
-        exit_action = QAction(QIcon.fromTheme("application-exit"), "&Salir", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.setStatusTip("Salir de la aplicación")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # Menú Reproducción
-        playback_menu = self.menuBar().addMenu("&Reproducción")
-        
-        # Acción Reproducir/Pausar
-        self.play_action = QAction(self.style().standardIcon(QStyle.SP_MediaPlay), "&Reproducir", self)
-        self.play_action.setShortcut("Space")
-        self.play_action.setStatusTip("Reproducir o pausar la canción actual")
-        self.play_action.triggered.connect(self._on_play_action)
-        playback_menu.addAction(self.play_action)
-        
-        # Acción Detener
-        stop_action = QAction(self.style().standardIcon(QStyle.SP_MediaStop), "&Detener", self)
-        stop_action.setShortcut("Ctrl+S")
-        stop_action.setStatusTip("Detener la reproducción")
-        stop_action.triggered.connect(self._on_stop_action)
-        playback_menu.addAction(stop_action)
-        
-        # Separador
-        playback_menu.addSeparator()
-        
-        # Acción Anterior
-        prev_action = QAction(self.style().standardIcon(QStyle.SP_MediaSkipBackward), "A&nterior", self)
-        prev_action.setShortcut("Ctrl+Left")
-        prev_action.setStatusTip("Ir a la canción anterior")
-        prev_action.triggered.connect(self._on_prev_action)
-        playback_menu.addAction(prev_action)
-        
-        # Acción Siguiente
-        next_action = QAction(self.style().standardIcon(QStyle.SP_MediaSkipForward), "&Siguiente", self)
-        next_action.setShortcut("Ctrl+Right")
-        next_action.setStatusTip("Ir a la siguiente canción")
-        next_action.triggered.connect(self._on_next_action)
-        playback_menu.addAction(next_action)
-        
-        # Menú Ayuda
-        help_menu = self.menuBar().addMenu("A&yuda")
-        
-        # Acción Acerca de
-        about_action = QAction("&Acerca de", self)
-        about_action.setStatusTip("Mostrar información acerca de la aplicación")
-        about_action.triggered.connect(self._on_about_action)
-        help_menu.addAction(about_action)
+        # Cada menú lista sus acciones como (icono, texto, atajo, ayuda, manejador);
+        # None indica un separador. Los iconos de texto se buscan en el tema
+        menus = (
+            ("&Archivo", (
+                ("document-open", "&Abrir...", "Ctrl+O",
+                 "Abrir archivos de audio", self._on_open_action),
+                None,
+                ("application-exit", "&Salir", "Ctrl+Q",
+                 "Salir de la aplicación", self.close),
+            )),
+            ("&Reproducción", (
+                (self._icon_play, "&Reproducir", "Space",
+                 "Reproducir o pausar la canción actual", self._on_play_action),
+                (self._icon_stop, "&Detener", "Ctrl+S",
+                 "Detener la reproducción", self._on_stop_action),
+                None,
+                (self._icon_prev, "A&nterior", "Ctrl+Left",
+                 "Ir a la canción anterior", self._on_prev_action),
+                (self._icon_next, "&Siguiente", "Ctrl+Right",
+                 "Ir a la siguiente canción", self._on_next_action),
+            )),
+            ("A&yuda", (
+                (None, "&Acerca de", None,
+                 "Mostrar información acerca de la aplicación", self._on_about_action),
+            )),
+        )
+        
+        menu_bar = self.menuBar()
+        for title, specs in menus:
+            menu = menu_bar.addMenu(title)
+            
+            for spec in specs:
+                if spec is None:
+                    menu.addSeparator()
+                    continue
+                
+                icon, text, shortcut, tip, slot = spec
+                if icon is None:
+                    action = QAction(text, self)
+                else:
+                    if isinstance(icon, str):
+                        icon = QIcon.fromTheme(icon)
+                    action = QAction(icon, text, self)
+                
+                if shortcut:
+                    action.setShortcut(shortcut)
+                action.setStatusTip(tip)
+                action.triggered.connect(slot)
+                menu.addAction(action)
+                
+                # La acción Reproducir/Pausar cambia de icono y texto según el estado
+                if slot == self._on_play_action:
+                    self.play_action = action
     
     def _setup_status_bar(self):
         """
@@ -161,22 +312,45 @@ class MainWindow(QMainWindow):
         # Etiqueta para mostrar información
         self.status_label = QLabel("Listo")
         self.statusBar.addPermanentWidget(self.status_label)
+        
+        # Último texto mostrado, para no repetir setText con el mismo texto
+        self._last_status = "Listo"
+    
+    def _set_status(self, text):
+        """
+        Muestra un texto en la barra de estado si es distinto del actual.
+        
+        Args:
+            text (str): Texto a mostrar.
+        """
+        if text != self._last_status:
+            self._last_status = text
+            self.status_label.setText(text)
     
     def _connect_signals(self):
         """
         Conecta las señales de los widgets con sus manejadores.
         """
-        # Señales del widget de reproducción
-        self.player_widget.play_button_clicked.connect(self._on_play_button_clicked)
-        self.player_widget.stop_button_clicked.connect(self._on_stop_button_clicked)
-        self.player_widget.next_button_clicked.connect(self._on_next_button_clicked)
-        self.player_widget.prev_button_clicked.connect(self._on_prev_button_clicked)
-        self.player_widget.song_finished.connect(self._on_song_finished)
-        
-        # Señales del widget de lista de reproducción
-        self.playlist_widget.song_selected.connect(self._on_song_selected)
-        self.playlist_widget.song_added.connect(self._on_song_added)
-        self.playlist_widget.song_removed.connect(self._on_song_removed)
+        player = self.player_widget
+        playlist = self.playlist_widget
+        
+        connections = (
+            # Señales del widget de reproducción
+            (player.play_button_clicked, self._on_play_button_clicked),
+            (player.stop_button_clicked, self._on_stop_button_clicked),
+            (player.next_button_clicked, self._on_next_button_clicked),
+            (player.prev_button_clicked, self._on_prev_button_clicked),
+            (player.prefetch_requested, self._on_prefetch_requested),
+            (player.song_finished, self._on_song_finished),
+            
+            # Señales del widget de lista de reproducción
+            (playlist.song_selected, self._on_song_selected),
+            (playlist.songs_added, self._on_songs_added),
+            (playlist.song_removed, self._on_song_removed),
+        )
+        
+        for signal, slot in connections:
+            signal.connect(slot)
     
     def _on_open_action(self):
         """
@@ -217,60 +391,50 @@ class MainWindow(QMainWindow):
         Manejador para la acción Acerca de.
         Muestra un diálogo con información acerca de la aplicación.
         """
-        # Crear un QMessageBox personalizado
-        msg_box = QMessageBox(self)
-        msg_box.setWindowTitle("Acerca de Reproductor de Música")
-        
-        # Establecer el texto con formato HTML
-        msg_box.setText("""<h2 style="color: #333333; text-align: center;">Reproductor de Música</h2>
-        <p style="color: #333333; text-align: center;"><b>Versión 1.0</b></p>
-        <hr>
-        <p style="color: #333333;">Un reproductor de música desarrollado con PyQt5 que utiliza una 
-        lista doblemente enlazada circular para gestionar la lista de reproducción.</p>
-        
-        <p style="color: #333333;"><b>Características principales:</b></p>
-        <ul style="color: #333333;">
-            <li>Reproducción de archivos MP3, WAV y OGG</li>
-            <li>Gestión de lista de reproducción (agregar/eliminar canciones)</li>
-            <li>Controles de reproducción (reproducir, pausar, detener)</li>
-            <li>Navegación entre canciones (anterior/siguiente)</li>
-            <li>Extracción automática de metadatos</li>
-            <li>Interfaz gráfica moderna con tema oscuro</li>
-        </ul>
-        
-        <p style="color: #333333;"><b>Desarrollado para:</b><br>
-        Estructura de Datos I<br>
-        Universidad Rafael Landívar<br>
-        2025</p>
-        
-        <p style="color: #333333;"><b>Desarrollado por:</b><br>
-        Jordin García</p>""")
-        
-        # Configurar los botones
-        msg_box.setStandardButtons(QMessageBox.Ok)
+        # Crear el diálogo la primera vez y reutilizarlo en las siguientes
+        if self._about_box is None:
+            msg_box = QMessageBox(self)
+            msg_box.setWindowTitle("Acerca de Reproductor de Música")
+            
+            # Establecer el texto con formato HTML
+            msg_box.setText(_ABOUT_HTML)
+            
+            # Configurar los botones
+            msg_box.setStandardButtons(QMessageBox.Ok)
+            
+            self._about_box = msg_box
         
         # Mostrar el diálogo
-        msg_box.exec_()
+        self._about_box.exec_()
+    
+    def _set_play_state(self, playing):
+        """
+        Actualiza la acción Reproducir/Pausar del menú según el estado.
+        
+        Args:
+            playing (bool): True si se está reproduciendo (la acción ofrece pausar),
+                False en caso contrario (la acción ofrece reproducir).
+        """
+        if playing:
+            self.play_action.setIcon(self._icon_pause)
+            self.play_action.setText("&Pausar")
+        else:
+            self.play_action.setIcon(self._icon_play)
+            self.play_action.setText("&Reproducir")
     
     def _on_play_button_clicked(self):
         """
         Manejador para el evento de clic en el botón de reproducción/pausa.
         """
         # Actualizar el icono de la acción del menú
-        if self.player_widget.audio_player.is_playing():
-            self.play_action.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
-            self.play_action.setText("&Reproducir")
-        else:
-            self.play_action.setIcon(self.style().standardIcon(QStyle.SP_MediaPause))
-            self.play_action.setText("&Pausar")
+        self._set_play_state(not self.player_widget.is_playing())
     
     def _on_stop_button_clicked(self):
         """
         Manejador para el evento de clic en el botón de detención.
         """
         # Restaurar el icono de la acción del menú
-        self.play_action.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
-        self.play_action.setText("&Reproducir")
+        self._set_play_state(False)
     
     def _on_next_button_clicked(self):
         """
@@ -282,7 +446,7 @@ class MainWindow(QMainWindow):
         # Si hay una siguiente canción, cargarla
         if next_song:
             self.player_widget.load_song(next_song)
-            self.status_label.setText(f"Reproduciendo: {next_song.titulo}")
+            self._set_status(f"Reproduciendo: {next_song.titulo}")
     
     def _on_prev_button_clicked(self):
         """
@@ -294,18 +458,43 @@ class MainWindow(QMainWindow):
         # Si hay una canción anterior, cargarla
         if prev_song:
             self.player_widget.load_song(prev_song)
-            self.status_label.setText(f"Reproduciendo: {prev_song.titulo}")
+            self._set_status(f"Reproduciendo: {prev_song.titulo}")
     
     def _on_song_finished(self):
         """
         Manejador para el evento de finalización de reproducción.
+        
+        El avance se programa para el siguiente ciclo de eventos, fuera del
+        manejador de fin de medio del reproductor. Si llega otro aviso de fin
+        antes de que se ejecute, se ignora para no avanzar dos veces.
         """
-        # Restaurar el icono de la acción del menú
-        self.play_action.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
-        self.play_action.setText("&Reproducir")
+        if self._advance_pending:
+            return
         
-        # Avanzar automáticamente a la siguiente canción
-        self._on_next_button_clicked()
+        self._advance_pending = True
+        QTimer.singleShot(0, self._advance_after_finish)
+    
+    def _advance_after_finish(self):
+        """
+        Avanza a la siguiente canción después de que termina la actual.
+        """
+        try:
+            # Restaurar el icono de la acción del menú
+            self._set_play_state(False)
+            
+            # Avanzar automáticamente a la siguiente canción
+            self._on_next_button_clicked()
+        finally:
+            self._advance_pending = False
+    
+    def _on_prefetch_requested(self):
+        """
+        Manejador para la solicitud de preparar las canciones vecinas.
+        """
+        # Preparar las canciones que pueden cargarse a continuación:
+        # la siguiente (al terminar o con Siguiente) y la anterior
+        self.player_widget.prefetch_song(self.playlist_widget.peek_next_song())
+        self.player_widget.prefetch_song(self.playlist_widget.peek_prev_song())
     
     def _on_song_selected(self, song_node):
         """
@@ -318,28 +507,34 @@ class MainWindow(QMainWindow):
         self.player_widget.load_song(song_node)
         
         # Actualizar el estado
-        self.status_label.setText(f"Reproduciendo: {song_node.titulo}")
+        self._set_status(f"Reproduciendo: {song_node.titulo}")
         
         # Actualizar el icono de la acción del menú
-        self.play_action.setIcon(self.style().standardIcon(QStyle.SP_MediaPause))
-        self.play_action.setText("&Pausar")
+        self._set_play_state(True)
     
-    def _on_song_added(self, song_node):
+    def _on_songs_added(self, song_nodes):
         """
-        Manejador para el evento de canción agregada.
+        Manejador para el evento de lote de canciones agregadas.
         
         Args:
-            song_node (NodoCancion): Nodo de la canción agregada.
-        """
-        # Si es la primera canción, cargarla automáticamente
-        if self.playlist_widget.lista_reproduccion.tamanio == 1:
-            self.player_widget.load_song(song_node)
-            self.playlist_widget.set_current_song(song_node)  # Actualizar visualización
-            self.status_label.setText(f"Reproduciendo: {song_node.titulo}")
-            self.play_action.setIcon(self.style().standardIcon(QStyle.SP_MediaPause))
-            self.play_action.setText("&Pausar")
-        else:
-            self.status_label.setText(f"Canción agregada: {song_node.titulo}")
+            song_nodes (list): Nodos de las canciones agregadas, en orden.
+        """
+        # Si no hay ninguna canción cargada, cargar la primera del lote
+        # automáticamente (las canciones llegan por lotes, así que el tamaño
+        # de la lista no indica cuál fue la primera)
+        primera = song_nodes[0]
+        if not self._has_song:
+            self._has_song = True
+            self.player_widget.load_song(primera)
+            self.playlist_widget.set_current_song(primera)  # Actualizar visualización
+            self._set_status(f"Reproduciendo: {primera.titulo}")
+            self._set_play_state(True)
+            
+            # El resto del lote se informa como canciones agregadas
+            if len(song_nodes) == 1:
+                return
+        
+        self._set_status(f"Canción agregada: {song_nodes[-1].titulo}")
     
     def _on_song_removed(self, song_node):
         """
@@ -349,147 +544,33 @@ class MainWindow(QMainWindow):
             song_node (NodoCancion): Nodo de la canción eliminada.
         """
         # Actualizar el estado
-        self.status_label.setText(f"Canción eliminada: {song_node.titulo}")
+        self._set_status(f"Canción eliminada: {song_node.titulo}")
         
         # Si la canción eliminada es la que se está reproduciendo,
         # detener la reproducción o cargar la nueva canción actual
-        if song_node == self.player_widget.get_current_song():
+        if song_node is self.player_widget.get_current_song():
             current_song = self.playlist_widget.get_current_song()
             if current_song:
                 self.player_widget.load_song(current_song)
-                self.status_label.setText(f"Reproduciendo: {current_song.titulo}")
+                self._set_status(f"Reproduciendo: {current_song.titulo}")
             else:
-                self.player_widget.audio_player.stop()
+                self.player_widget.stop()
                 self.player_widget.current_song = None
                 self.player_widget.title_label.setText("No hay canción seleccionada")
                 self.player_widget.artist_label.setText("")
-                self.play_action.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
-                self.play_action.setText("&Reproducir")
+                self._set_play_state(False)
+                self._has_song = False
     
     def _apply_dark_theme(self):
         """
         Aplica un tema oscuro a la aplicación.
         """
-        # Definir una paleta oscura
-        palette = QPalette()
-        
-        # Colores de fondo
-        palette.setColor(QPalette.Window, QColor(53, 53, 53))
-        palette.setColor(QPalette.WindowText, Qt.white)
-        palette.setColor(QPalette.Base, QColor(25, 25, 25))
-        palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
-        palette.setColor(QPalette.ToolTipBase, Qt.white)
-        palette.setColor(QPalette.ToolTipText, Qt.white)
+        # Aplicar la paleta oscura compartida
+        self.setPalette(_get_dark_palette())
         
-        # Colores de texto
-        palette.setColor(QPalette.Text, Qt.white)
-        palette.setColor(QPalette.Button, QColor(53, 53, 53))
-        palette.setColor(QPalette.ButtonText, Qt.white)
-        
-        # Colores de selección
-        palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
-        palette.setColor(QPalette.HighlightedText, Qt.black)
-        
-        # Roles deshabilitados
-        palette.setColor(QPalette.Disabled, QPalette.Text, Qt.darkGray)
-        palette.setColor(QPalette.Disabled, QPalette.ButtonText, Qt.darkGray)
-        
-        # Aplicar la paleta
-        self.setPalette(palette)
-        
-        # Estilo adicional para los widgets
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #353535;
-            }
-            QLabel {
-                color: #FFFFFF;
-            }
-            QPushButton {
-                background-color: #5A5A5A;
-                color: #FFFFFF;
-                border: 1px solid #5A5A5A;
-                padding: 5px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #6A6A6A;
-            }
-            QPushButton:pressed {
-                background-color: #7A7A7A;
-            }
-            QSlider::groove:horizontal {
-                border: 1px solid #999999;
-                height: 8px;
-                background: #4A4A4A;
-                margin: 2px 0;
-                border-radius: 4px;
-            }
-            QSlider::handle:horizontal {
-                background: #2A82DA;
-                border: 1px solid #2A82DA;
-                width: 18px;
-                margin: -2px 0;
-                border-radius: 3px;
-            }
-            QTableView {
-                background-color: #252525;
-                alternate-background-color: #2D2D2D;
-                color: #FFFFFF;
-                gridline-color: #353535;
-            }
-            QHeaderView::section {
-                background-color: #3F3F3F;
-                color: #FFFFFF;
-                padding: 4px;
-                border: 1px solid #5F5F5F;
-            }
-            QMenuBar {
-                background-color: #353535;
-                color: #FFFFFF;
-            }
-            QMenuBar::item:selected {
-                background-color: #454545;
-            }
-            QMenu {
-                background-color: #353535;
-                color: #FFFFFF;
-            }
-            QMenu::item:selected {
-                background-color: #454545;
-            }
-            QStatusBar {
-                background-color: #252525;
-                color: #FFFFFF;
-            }
-        """)
-        
-        # Aplicar tema oscuro a la barra de menús
-        self.menuBar().setStyleSheet("""
-            QMenuBar {
-                background-color: #353535;
-                color: #FFFFFF;
-            }
-            QMenuBar::item {
-                background-color: transparent;
-            }
-            QMenuBar::item:selected {
-                background-color: #454545;
-            }
-        """)
-        
-        # Aplicar tema oscuro al menú
-        qApp = QApplication.instance()
-        qApp.setStyleSheet("""
-            QMenu {
-                background-color: #353535;
-                color: #FFFFFF;
-                border: 1px solid #5A5A5A;
-            }
-            QMenu::item:selected {
-                background-color: #454545;
-            }
-        """)
+        # Estilo adicional para los widgets, aplicado una sola vez a toda la
+        # aplicación (incluye la barra de menús y los menús desplegables)
+        QApplication.instance().setStyleSheet(_DARK_QSS_APP)
     
     def closeEvent(self, event):
         """
@@ -499,7 +580,10 @@ class MainWindow(QMainWindow):
             event: Evento de cierre.
         """
         # Detener la reproducción
-        self.player_widget.audio_player.stop()
+        self.player_widget.stop()
+        
+        # Detener la lectura de metadatos antes de destruir los widgets
+        self.playlist_widget.stop_imports()
         
         # Aceptar el evento para cerrar la ventana
         event.accept() 
\ No newline at end of file
@@ -10,12 +10,28 @@ canción actual.
 from PyQt5.QtWidgets import (QWidget, QPushButton, QSlider, QLabel,
                            QHBoxLayout, QVBoxLayout, QStyle,
                            QSizePolicy, QFrame)
-from PyQt5.QtCore import Qt, QTime, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont, QPalette, QColor
 
 from player.audio_player import AudioPlayer
 
 
+def _fmt_ms(ms):
+    """
+    Da formato MM:SS a un tiempo en milisegundos.
+    
+    Los minutos no se reinician a cero al pasar de una hora (75:03).
+    
+    Args:
+        ms (int): Tiempo en milisegundos.
+    
+    Returns:
+        str: Tiempo en formato "MM:SS".
+    """
+    minutes, seconds = divmod(ms // 1000, 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+
 class PlayerWidget(QWidget):
     """
     Widget que proporciona controles para el reproductor de audio.
@@ -24,7 +40,8 @@ class PlayerWidget(QWidget):
     control de volumen y visualización de información de la canción actual.
     
     Attributes:
-        audio_player (AudioPlayer): Reproductor de audio.
+        audio_player (AudioPlayer): Reproductor de audio (None hasta que se
+            carga la primera canción).
         current_song (object): Canción actual.
         
     Signals:
@@ -33,6 +50,7 @@ class PlayerWidget(QWidget):
         next_button_clicked: Emitido cuando se hace clic en el botón de siguiente.
         prev_button_clicked: Emitido cuando se hace clic en el botón de anterior.
         song_finished: Emitido cuando se completa la reproducción de una canción.
+        prefetch_requested: Emitido cuando conviene preparar la siguiente canción.
     """
     
     # Definición de señales
@@ -41,6 +59,17 @@ class PlayerWidget(QWidget):
     next_button_clicked = pyqtSignal()
     prev_button_clicked = pyqtSignal()
     song_finished = pyqtSignal()
+    prefetch_requested = pyqtSignal()
+    
+    # Textos de ayuda del botón de reproducción/pausa
+    _TT_PLAY = "Reproducir"
+    _TT_PAUSE = "Pausar"
+    
+    # Texto de las etiquetas de tiempo sin canción o al inicio (mismo formato que _fmt_ms)
+    _TIME_ZERO = "00:00"
+    
+    # Espera desde el último cambio del volumen antes de aplicarlo
+    VOLUME_DEBOUNCE_MS = 50
     
     def __init__(self, parent=None):
         """
@@ -51,10 +80,31 @@ class PlayerWidget(QWidget):
         """
         super().__init__(parent)
         
-        # Inicializar el reproductor de audio
-        self.audio_player = AudioPlayer()
+        # El reproductor de audio se crea al cargar la primera canción
+        # (ver _ensure_player), para no iniciar el sistema de audio al abrir
+        self.audio_player = None
         self.current_song = None
         
+        # Último segundo y porcentaje mostrados (-1: ninguno todavía), para
+        # no actualizar las etiquetas ni la barra si no cambiaron
+        self._last_sec = -1
+        self._last_pct = -1
+        
+        # Duración de la canción actual en ms, actualizada con durationChanged
+        self._duration_ms = 0
+        
+        # Indica si positionChanged está conectado (solo durante la reproducción)
+        self._pos_connected = False
+        
+        # Temporizador que aplica el volumen cuando el control deja de moverse,
+        # para no llamar al reproductor con cada valor intermedio
+        self._pending_volume = 0
+        self._vol_timer = QTimer(self)
+        self._vol_timer.setSingleShot(True)
+        self._vol_timer.setInterval(self.VOLUME_DEBOUNCE_MS)
+        self._vol_timer.setTimerType(Qt.CoarseTimer)
+        self._vol_timer.timeout.connect(self._apply_volume)
+        
         # Configurar la interfaz de usuario
         self._setup_ui()
         
@@ -65,6 +115,14 @@ class PlayerWidget(QWidget):
         """
         Configura los elementos de la interfaz de usuario.
         """
+        # Obtener una sola vez los iconos estándar que se reutilizan
+        style = self.style()
+        self._icon_play = style.standardIcon(QStyle.SP_MediaPlay)
+        self._icon_pause = style.standardIcon(QStyle.SP_MediaPause)
+        self._icon_stop = style.standardIcon(QStyle.SP_MediaStop)
+        self._icon_prev = style.standardIcon(QStyle.SP_MediaSkipBackward)
+        self._icon_next = style.standardIcon(QStyle.SP_MediaSkipForward)
+        
         # Crear layout principal
         main_layout = QVBoxLayout(self)
         
@@ -98,7 +156,7 @@ class PlayerWidget(QWidget):
         progress_layout = QHBoxLayout()
         
         # Etiqueta para el tiempo transcurrido
-        self.time_label = QLabel("00:00")
+        self.time_label = QLabel(self._TIME_ZERO)
         
         # Slider para el progreso
         self.progress_slider = QSlider(Qt.Horizontal)
@@ -107,7 +165,7 @@ class PlayerWidget(QWidget):
         self.progress_slider.setTracking(False)  # Solo enviar valor cuando se suelta
         
         # Etiqueta para la duración total
-        self.duration_label = QLabel("00:00")
+        self.duration_label = QLabel(self._TIME_ZERO)
         
         # Agregar widgets al layout de progreso
         progress_layout.addWidget(self.time_label)
@@ -119,22 +177,22 @@ class PlayerWidget(QWidget):
         
         # Botón para ir a la canción anterior
         self.prev_button = QPushButton()
-        self.prev_button.setIcon(self.style().standardIcon(QStyle.SP_MediaSkipBackward))
+        self.prev_button.setIcon(self._icon_prev)
         self.prev_button.setToolTip("Canción anterior")
         
         # Botón para reproducir/pausar
         self.play_button = QPushButton()
-        self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
-        self.play_button.setToolTip("Reproducir")
+        self.play_button.setIcon(self._icon_play)
+        self.play_button.setToolTip(self._TT_PLAY)
         
         # Botón para detener
         self.stop_button = QPushButton()
-        self.stop_button.setIcon(self.style().standardIcon(QStyle.SP_MediaStop))
+        self.stop_button.setIcon(self._icon_stop)
         self.stop_button.setToolTip("Detener")
         
         # Botón para ir a la siguiente canción
         self.next_button = QPushButton()
-        self.next_button.setIcon(self.style().standardIcon(QStyle.SP_MediaSkipForward))
+        self.next_button.setIcon(self._icon_next)
         self.next_button.setToolTip("Siguiente canción")
         
         # Agregar botones al layout de controles
@@ -170,28 +228,47 @@ class PlayerWidget(QWidget):
         # Establecer el layout
         self.setLayout(main_layout)
         
-        # Establecer el volumen inicial
-        self.audio_player.set_volume(self.volume_slider.value())
+        # Volumen inicial, aplicado al crear el reproductor
+        self._pending_volume = self.volume_slider.value()
     
     def _connect_signals(self):
         """
         Conecta las señales de los widgets con sus manejadores.
         """
-        # Conectar botones
+        # Conectar botones (siguiente y anterior solo reenvían el clic, así
+        # que se conectan directamente a las señales del widget)
         self.play_button.clicked.connect(self._on_play_clicked)
         self.stop_button.clicked.connect(self._on_stop_clicked)
-        self.next_button.clicked.connect(self._on_next_clicked)
-        self.prev_button.clicked.connect(self._on_prev_clicked)
+        self.next_button.clicked.connect(self.next_button_clicked)
+        self.prev_button.clicked.connect(self.prev_button_clicked)
         
         # Conectar sliders
         self.progress_slider.sliderReleased.connect(self._on_progress_changed)
         self.volume_slider.valueChanged.connect(self._on_volume_changed)
+    
+    def _ensure_player(self):
+        """
+        Crea el reproductor de audio si todavía no existe.
         
-        # Conectar señales del reproductor
-        self.audio_player.positionChanged.connect(self._on_position_changed)
-        self.audio_player.durationChanged.connect(self._on_duration_changed)
-        self.audio_player.stateChanged.connect(self._on_state_changed)
-        self.audio_player.playbackCompleted.connect(self._on_playback_completed)
+        Returns:
+            AudioPlayer: El reproductor de audio.
+        """
+        if self.audio_player is None:
+            self.audio_player = AudioPlayer()
+            
+            # Conectar señales del reproductor (positionChanged se conecta en
+            # _on_state_changed al empezar a reproducir). El reproductor vive
+            # en el hilo de la interfaz, así que las conexiones son directas
+            direct = Qt.DirectConnection
+            self.audio_player.durationChanged.connect(self._on_duration_changed, direct)
+            self.audio_player.stateChanged.connect(self._on_state_changed, direct)
+            self.audio_player.playbackCompleted.connect(self._on_playback_completed, direct)
+            self.audio_player.prefetchRequested.connect(self.prefetch_requested, direct)
+            
+            # Aplicar el volumen seleccionado hasta ahora
+            self.audio_player.set_volume(self._pending_volume)
+        
+        return self.audio_player
     
     def _on_play_clicked(self):
         """
@@ -200,16 +277,12 @@ class PlayerWidget(QWidget):
         if not self.current_song:
             return
         
-        # Si está reproduciendo, pausar
+        # Si está reproduciendo, pausar; si está pausado o detenido, reproducir
+        # (el botón se actualiza en _on_state_changed)
         if self.audio_player.is_playing():
             self.audio_player.pause()
-            self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
-            self.play_button.setToolTip("Reproducir")
-        # Si está pausado o detenido, reproducir
         else:
             self.audio_player.play()
-            self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPause))
-            self.play_button.setToolTip("Pausar")
         
         # Emitir señal
         self.play_button_clicked.emit()
@@ -222,42 +295,36 @@ class PlayerWidget(QWidget):
             return
         
         self.audio_player.stop()
-        self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
-        self.play_button.setToolTip("Reproducir")
+        
+        # La próxima posición debe mostrarse aunque coincida con la anterior
+        self._last_sec = -1
+        self._last_pct = -1
         
         # Emitir señal
         self.stop_button_clicked.emit()
     
-    def _on_next_clicked(self):
-        """
-        Manejador para el evento de clic en el botón de siguiente.
-        """
-        # Emitir señal
-        self.next_button_clicked.emit()
-    
-    def _on_prev_clicked(self):
-        """
-        Manejador para el evento de clic en el botón de anterior.
-        """
-        # Emitir señal
-        self.prev_button_clicked.emit()
-    
     def _on_progress_changed(self):
         """
         Manejador para el evento de cambio en la barra de progreso.
         """
-        if not self.current_song:
+        # Solo se llama al soltar la barra (setTracking(False)), así que cada
+        # arrastre produce un único salto de posición
+        duration = self._duration_ms
+        if not self.current_song or duration <= 0:
             return
         
         # Obtener la posición seleccionada
         position = self.progress_slider.value()
-        duration = self.audio_player.get_duration()
         
         # Convertir de porcentaje a milisegundos
-        position_ms = int(position * duration / 100)
+        position_ms = position * duration // 100
         
         # Establecer la posición
         self.audio_player.seek(position_ms)
+        
+        # Mostrar la nueva posición de inmediato, sin esperar a la siguiente
+        # notificación del reproductor (en pausa ni siquiera está conectada)
+        self._on_position_changed(position_ms)
     
     def _on_volume_changed(self, value):
         """
@@ -266,7 +333,17 @@ class PlayerWidget(QWidget):
         Args:
             value (int): Nuevo valor del volumen (0-100).
         """
-        self.audio_player.set_volume(value)
+        # Guardar el valor y aplicarlo cuando el control deje de moverse
+        self._pending_volume = value
+        self._vol_timer.start()
+    
+    def _apply_volume(self):
+        """
+        Aplica al reproductor el último volumen seleccionado.
+        """
+        # Sin reproductor, el volumen se aplicará al crearlo
+        if self.audio_player is not None:
+            self.audio_player.set_volume(self._pending_volume)
     
     def _on_position_changed(self, position):
         """
@@ -275,17 +352,24 @@ class PlayerWidget(QWidget):
         Args:
             position (int): Posición actual en milisegundos.
         """
-        # Actualizar la etiqueta de tiempo
-        time = QTime(0, 0)
-        time = time.addMSecs(position)
-        self.time_label.setText(time.toString("mm:ss"))
+        # Actualizar la etiqueta de tiempo solo si cambió el segundo mostrado
+        sec = position // 1000
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self.time_label.setText(_fmt_ms(position))
         
         # Actualizar la barra de progreso solo si no está siendo arrastrada
-        duration = self.audio_player.get_duration()
+        # y el porcentaje cambió
+        duration = self._duration_ms
         if duration > 0 and not self.progress_slider.isSliderDown():
             # Convertir a porcentaje (0-100)
-            position_percent = int(position * 100 / duration)
-            self.progress_slider.setValue(position_percent)
+            position_percent = position * 100 // duration
+            if position_percent != self._last_pct:
+                self._last_pct = position_percent
+                
+                # La barra puede mostrar ya ese valor (por ejemplo, tras soltarla)
+                if position_percent != self.progress_slider.value():
+                    self.progress_slider.setValue(position_percent)
     
     def _on_duration_changed(self, duration):
         """
@@ -294,10 +378,10 @@ class PlayerWidget(QWidget):
         Args:
             duration (int): Duración en milisegundos.
         """
+        self._duration_ms = duration
+        
         # Actualizar la etiqueta de duración
-        time = QTime(0, 0)
-        time = time.addMSecs(duration)
-        self.duration_label.setText(time.toString("mm:ss"))
+        self.duration_label.setText(_fmt_ms(duration))
     
     def _on_state_changed(self, state):
         """
@@ -305,17 +389,45 @@ class PlayerWidget(QWidget):
         
         Args:
             state (QMediaPlayer.State): Nuevo estado del reproductor.
+        
+        Es el único lugar donde se actualiza el botón de reproducción/pausa,
+        de modo que siempre refleja el estado real del reproductor.
         """
-        pass  # Ya manejamos los cambios de estado en otros métodos
+        playing = self.audio_player.is_playing()
+        
+        # Mostrar pausar mientras se reproduce y reproducir en otro caso
+        if playing:
+            self.play_button.setIcon(self._icon_pause)
+            self.play_button.setToolTip(self._TT_PAUSE)
+        else:
+            self.play_button.setIcon(self._icon_play)
+            self.play_button.setToolTip(self._TT_PLAY)
+        
+        # Escuchar la posición solo mientras se reproduce: en pausa o detenido
+        # no cambia y no hace falta procesar sus notificaciones
+        if playing:
+            if not self._pos_connected:
+                self.audio_player.positionChanged.connect(self._on_position_changed,
+                                                          Qt.DirectConnection)
+                self._pos_connected = True
+                
+                # Mostrar la posición actual sin esperar a la siguiente notificación
+                self._on_position_changed(self.audio_player.get_position())
+        else:
+            if self._pos_connected:
+                self.audio_player.positionChanged.disconnect(self._on_position_changed)
+                self._pos_connected = False
+            
+            # Al detener, la posición vuelve al inicio y debe mostrarse de nuevo
+            self._last_sec = -1
+            self._last_pct = -1
+            if not self.audio_player.is_paused():
+                self._on_position_changed(0)
     
     def _on_playback_completed(self):
         """
         Manejador para el evento de finalización de reproducción.
         """
-        # Restaurar el botón de reproducción
-        self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
-        self.play_button.setToolTip("Reproducir")
-        
         # Emitir señal
         self.song_finished.emit()
     
@@ -332,8 +444,9 @@ class PlayerWidget(QWidget):
         # Guardar referencia a la canción actual
         self.current_song = song_node
         
-        # Cargar el archivo de audio
-        self.audio_player.load(song_node.ruta)
+        # Cargar el archivo de audio (la duración llega luego con durationChanged)
+        self._duration_ms = 0
+        self._ensure_player().load(song_node.ruta)
         
         # Actualizar la información de la canción
         self.title_label.setText(song_node.titulo)
@@ -341,12 +454,40 @@ class PlayerWidget(QWidget):
         
         # Reiniciar la barra de progreso
         self.progress_slider.setValue(0)
-        self.time_label.setText("00:00")
+        self.time_label.setText(self._TIME_ZERO)
+        self._last_sec = -1
+        self._last_pct = -1
         
         # Iniciar la reproducción automáticamente
         self.audio_player.play()
-        self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPause))
-        self.play_button.setToolTip("Pausar")
+    
+    def prefetch_song(self, song_node):
+        """
+        Prepara por adelantado una canción para que cargue sin demora.
+        
+        Args:
+            song_node (NodoCancion): Nodo de la canción que se reproducirá después.
+        """
+        if not song_node:
+            return
+        
+        self._ensure_player().prefetch(song_node.ruta)
+    
+    def is_playing(self):
+        """
+        Verifica si se está reproduciendo una canción.
+        
+        Returns:
+            bool: True si está reproduciendo, False en caso contrario.
+        """
+        return self.audio_player is not None and self.audio_player.is_playing()
+    
+    def stop(self):
+        """
+        Detiene la reproducción, si el reproductor ya fue creado.
+        """
+        if self.audio_player is not None:
+            self.audio_player.stop()
     
     def get_current_song(self):
         """
@@ -7,13 +7,27 @@ la lista de canciones y permite interactuar con ella.
 
 from PyQt5.QtWidgets import (QWidget, QTableView, QAbstractItemView,
                             QHeaderView, QVBoxLayout, QPushButton,
-                            QHBoxLayout, QStyle, QFileDialog, QMessageBox)
-from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
-from PyQt5.QtGui import QIcon, QFont, QColor
+                            QHBoxLayout, QStyle, QFileDialog, QApplication,
+                            QStyledItemDelegate, QStyleOptionViewItem)
+from PyQt5.QtCore import (Qt, QAbstractTableModel, QModelIndex, QThreadPool,
+                          pyqtSignal)
+from PyQt5.QtGui import (QIcon, QFont, QColor, QBrush, QPalette, QFontMetrics,
+                         QPixmap, QPixmapCache, QPainter)
 
 from models.playlist import ListaReproduccion
-from mutagen.mp3 import MP3
-import os
+from player import metadata_cache
+from player.metadata_loader import MetadataSignals, MetadataTask
+
+
+# Roles y alineaciones usados en PlaylistModel, resueltos una sola vez
+# (data() se llama por cada celda visible en cada repintado)
+_DISPLAY = Qt.DisplayRole
+_ALIGN = Qt.TextAlignmentRole
+_FONT = Qt.FontRole
+_BG = Qt.BackgroundRole
+_FG = Qt.ForegroundRole
+_ALIGN_R = Qt.AlignRight | Qt.AlignVCenter
+_ALIGN_L = Qt.AlignLeft | Qt.AlignVCenter
 
 
 class PlaylistModel(QAbstractTableModel):
@@ -21,14 +35,28 @@ class PlaylistModel(QAbstractTableModel):
     Modelo de datos para la vista de tabla de la lista de reproducción.
     
     Esta clase implementa el modelo de datos necesario para mostrar
-    la información de las canciones en una tabla.
+    la información de las canciones en una tabla. Los valores que devuelve
+    data() se guardan por (fila, columna, rol), ya que la vista los pide
+    de nuevo en cada repintado.
+    
+    Los textos de las columnas se guardan en listas paralelas (una por
+    columna) construidas en update_canciones, de modo que data() solo
+    indexa una lista; canciones se conserva para identificar los nodos.
     
     Attributes:
         canciones (list): Lista de nodos de canciones a mostrar.
         headers (list): Títulos de las columnas de la tabla.
         cancion_actual (NodoCancion): Referencia a la canción que se está reproduciendo.
+        generacion (int): Contador que aumenta cada vez que cambian las canciones.
     """
     
+    # Rol con todo lo necesario para dibujar una celda, usado por PlaylistDelegate:
+    # tupla (texto, alineación, fuente, fondo, color del texto)
+    CellRole = Qt.UserRole + 1
+    
+    # Roles cuyo valor depende de si la fila es la canción actual
+    _ROLES_ACTUAL = (_FONT, _BG, _FG, CellRole)
+    
     def __init__(self, parent=None):
         """
         Inicializa el modelo de datos.
@@ -40,6 +68,31 @@ class PlaylistModel(QAbstractTableModel):
         self.canciones = []
         self.headers = ["Título", "Artista", "Duración"]
         self.cancion_actual = None  # Referencia a la canción en reproducción
+        self.generacion = 0
+        
+        # Textos de cada columna, calculados una vez por canción en update_canciones
+        self._titulos = []
+        self._artistas = []
+        self._duracion_str = []
+        
+        # Fila de cada canción: id(nodo) -> fila
+        self._rows = {}
+        
+        # Valores ya calculados por data(): (fila, columna, rol) -> valor
+        self._cache = {}
+        
+        # Fila de cancion_actual (-1 si no hay o no está en el modelo)
+        self._current_row = -1
+        
+        # Fuentes compartidas por todas las filas (normal y canción actual)
+        self._font_normal = QFont()
+        self._font_normal.setPointSize(10)
+        self._font_bold = QFont(self._font_normal)
+        self._font_bold.setBold(True)
+        
+        # Colores compartidos para resaltar la canción actual
+        self._bg_current = QColor(42, 130, 218, 100)  # Azul semi-transparente
+        self._fg_current = QColor(255, 255, 255)      # Texto blanco
     
     def update_canciones(self, canciones):
         """
@@ -50,19 +103,70 @@ class PlaylistModel(QAbstractTableModel):
         """
         self.beginResetModel()
         self.canciones = canciones
+        
+        # Extraer los textos de las columnas; la duración se formatea como M:SS
+        self._titulos = [c.titulo for c in canciones]
+        self._artistas = [c.artista for c in canciones]
+        
+        # Muchas canciones comparten duración: formatear cada valor distinto
+        # una sola vez y reutilizar la misma cadena en todas sus filas
+        duraciones = [c.duracion for c in canciones]
+        formato = {d: f"{d // 60}:{d % 60:02d}" for d in set(duraciones)}
+        self._duracion_str = [formato[d] for d in duraciones]
+        
+        # Fila de cada nodo, para buscarla sin recorrer la lista; se indexa
+        # por id() porque los nodos se comparan por identidad (self.canciones
+        # mantiene vivos los nodos mientras el índice esté en uso)
+        self._rows = {id(c): i for i, c in enumerate(canciones)}
+        
+        self._cache.clear()
+        self._current_row = self._row_of(self.cancion_actual)
+        self.generacion += 1
         self.endResetModel()
     
     def set_cancion_actual(self, cancion):
         """
         Establece la canción que se está reproduciendo actualmente.
         
+        Solo cambian las filas de la canción anterior y de la nueva, así que
+        solo se descartan y se notifican los valores de esas dos filas.
+        
         Args:
             cancion (NodoCancion): Nodo de la canción actual.
         """
+        old_row = self._current_row
+        new_row = old_row if cancion is self.cancion_actual else self._row_of(cancion)
         self.cancion_actual = cancion
-        # Notificar cambio en todos los datos para que se actualice la vista
-        self.dataChanged.emit(self.index(0, 0), 
-                              self.index(self.rowCount() - 1, self.columnCount() - 1))
+        self._current_row = new_row
+        
+        # Descartar los valores guardados que dependen de la canción actual
+        # y notificar solo esos roles en esas filas
+        roles = list(self._ROLES_ACTUAL)
+        ultima_columna = self.columnCount() - 1
+        for fila in {old_row, new_row}:
+            if fila < 0:
+                continue
+            for columna in range(ultima_columna + 1):
+                for rol in roles:
+                    self._cache.pop((fila, columna, rol), None)
+            
+            self.dataChanged.emit(self.index(fila, 0),
+                                  self.index(fila, ultima_columna), roles)
+    
+    def _row_of(self, cancion):
+        """
+        Obtiene la fila de una canción en el modelo.
+        
+        Args:
+            cancion (NodoCancion): Nodo de la canción a buscar.
+            
+        Returns:
+            int: Índice de la fila, o -1 si la canción es None o no está en el modelo.
+        """
+        if cancion is None:
+            return -1
+        
+        return self._rows.get(id(cancion), -1)
     
     def rowCount(self, parent=QModelIndex()):
         """
@@ -88,7 +192,7 @@ class PlaylistModel(QAbstractTableModel):
         """
         return len(self.headers)
     
-    def data(self, index, role=Qt.DisplayRole):
+    def data(self, index, role=_DISPLAY):
         """
         Devuelve los datos para mostrar en la tabla.
         
@@ -99,52 +203,71 @@ class PlaylistModel(QAbstractTableModel):
         Returns:
             Datos a mostrar según el rol solicitado.
         """
-        if not index.isValid() or not (0 <= index.row() < len(self.canciones)):
+        row = index.row()
+        if not index.isValid() or not (0 <= row < len(self.canciones)):
             return None
         
-        cancion = self.canciones[index.row()]
+        # Devolver el valor ya calculado, si existe (None también se guarda)
+        column = index.column()
+        key = (row, column, role)
+        cache = self._cache
+        if key in cache:
+            return cache[key]
         
-        # Verificar si la canción es la que se está reproduciendo actualmente
-        es_cancion_actual = (self.cancion_actual is not None and 
-                            cancion == self.cancion_actual)
-        
-        if role == Qt.DisplayRole:
-            if index.column() == 0:
-                return cancion.titulo
-            elif index.column() == 1:
-                return cancion.artista
-            elif index.column() == 2:
-                # Formatear duración como MM:SS
-                minutos = cancion.duracion // 60
-                segundos = cancion.duracion % 60
-                return f"{minutos}:{segundos:02d}"
-        
-        elif role == Qt.TextAlignmentRole:
-            if index.column() == 2:  # Alinear duración a la derecha
-                return Qt.AlignRight | Qt.AlignVCenter
-            return Qt.AlignLeft | Qt.AlignVCenter
-        
-        elif role == Qt.FontRole:
-            font = QFont()
-            font.setPointSize(10)
+        value = self._compute_data(row, column, role)
+        cache[key] = value
+        return value
+    
+    def _compute_data(self, row, column, role):
+        """
+        Calcula el valor de una celda para un rol.
+        
+        Args:
+            row (int): Fila de la celda.
+            column (int): Columna de la celda.
+            role: Rol de visualización.
             
+        Returns:
+            Datos a mostrar según el rol solicitado.
+        """
+        # Verificar si la canción es la que se está reproduciendo actualmente
+        # (la fila actual se calcula una vez por cambio de canción)
+        es_cancion_actual = row == self._current_row
+        
+        if role == self.CellRole:
+            # Reunir en un solo valor los roles que usa el delegado
+            return tuple(self._compute_data(row, column, r)
+                         for r in (_DISPLAY, _ALIGN, _FONT, _BG, _FG))
+        
+        elif role == _DISPLAY:
+            if column == 0:
+                return self._titulos[row]
+            elif column == 1:
+                return self._artistas[row]
+            elif column == 2:
+                # Duración ya formateada como MM:SS
+                return self._duracion_str[row]
+        
+        elif role == _ALIGN:
+            if column == 2:  # Alinear duración a la derecha
+                return _ALIGN_R
+            return _ALIGN_L
+        
+        elif role == _FONT:
             # Si es la canción actual, poner en negrita
-            if es_cancion_actual:
-                font.setBold(True)
-            
-            return font
+            return self._font_bold if es_cancion_actual else self._font_normal
         
-        elif role == Qt.BackgroundRole and es_cancion_actual:
+        elif role == _BG and es_cancion_actual:
             # Cambiar el color de fondo para la canción actual
-            return QColor(42, 130, 218, 100)  # Azul semi-transparente
+            return self._bg_current
         
-        elif role == Qt.ForegroundRole and es_cancion_actual:
+        elif role == _FG and es_cancion_actual:
             # Cambiar el color del texto para la canción actual
-            return QColor(255, 255, 255)  # Texto blanco
+            return self._fg_current
         
         return None
     
-    def headerData(self, section, orientation, role=Qt.DisplayRole):
+    def headerData(self, section, orientation, role=_DISPLAY):
         """
         Devuelve los datos para las cabeceras de la tabla.
         
@@ -156,13 +279,101 @@ class PlaylistModel(QAbstractTableModel):
         Returns:
             Datos de la cabecera según el rol solicitado.
         """
-        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+        if role == _DISPLAY and orientation == Qt.Horizontal:
             if 0 <= section < len(self.headers):
                 return self.headers[section]
         
         return None
 
 
+class PlaylistDelegate(QStyledItemDelegate):
+    """
+    Delegado que dibuja las celdas de la lista de reproducción.
+    
+    QStyledItemDelegate consulta el modelo una vez por cada rol (texto, fuente,
+    colores, alineación, icono...) en cada celda que dibuja. Este delegado
+    pide un único valor, PlaylistModel.CellRole, y completa con él las opciones
+    de estilo, de modo que la tabla mantiene su aspecto y sus columnas.
+    
+    Cada celda dibujada se guarda como imagen en QPixmapCache y se reutiliza
+    mientras no cambien su contenido, su estado ni su tamaño. La clave incluye
+    la generación del modelo y si la fila es la canción actual, de modo que
+    las imágenes antiguas no vuelven a usarse (QPixmapCache las descarta).
+    """
+    
+    def __init__(self, parent=None):
+        """
+        Inicializa el delegado.
+        
+        Args:
+            parent: Objeto padre (opcional).
+        """
+        super().__init__(parent)
+        
+        # Métricas por fuente (el modelo comparte solo dos fuentes)
+        self._metrics = {}
+    
+    def paint(self, painter, option, index):
+        """
+        Dibuja una celda.
+        
+        Args:
+            painter (QPainter): Pintor sobre el que se dibuja.
+            option (QStyleOptionViewItem): Opciones de estilo de la vista.
+            index (QModelIndex): Índice de la celda.
+        """
+        cell = index.data(PlaylistModel.CellRole)
+        if cell is None:
+            super().paint(painter, option, index)
+            return
+        
+        texto, alineacion, fuente, fondo, color_texto = cell
+        
+        # Reutilizar la imagen de la celda si ya se dibujó en el mismo estado
+        rect = option.rect
+        key = (f"playlist:{index.model().generacion}:{index.row()}:{index.column()}:"
+               f"{fondo is not None}:{int(option.state)}:{int(option.features)}:"
+               f"{rect.width()}x{rect.height()}")
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            painter.drawPixmap(rect.topLeft(), pixmap)
+            return
+        
+        # Completar las opciones como lo haría initStyleOption, sin consultar
+        # el modelo otra vez
+        opt = QStyleOptionViewItem(option)
+        opt.features |= QStyleOptionViewItem.HasDisplay
+        opt.text = texto
+        opt.displayAlignment = alineacion
+        opt.font = fuente
+        
+        metrics = self._metrics.get(fuente.key())
+        if metrics is None:
+            metrics = self._metrics[fuente.key()] = QFontMetrics(fuente)
+        opt.fontMetrics = metrics
+        
+        if fondo is not None:
+            opt.backgroundBrush = QBrush(fondo)
+        if color_texto is not None:
+            opt.palette.setColor(QPalette.Text, color_texto)
+        
+        # Dibujar la celda en una imagen transparente del tamaño de la celda
+        ratio = painter.device().devicePixelRatioF()
+        pixmap = QPixmap(rect.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        opt.rect = rect.translated(-rect.topLeft())
+        
+        widget = opt.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        pixmap_painter = QPainter(pixmap)
+        style.drawControl(QStyle.CE_ItemViewItem, opt, pixmap_painter, widget)
+        pixmap_painter.end()
+        
+        QPixmapCache.insert(key, pixmap)
+        painter.drawPixmap(rect.topLeft(), pixmap)
+
+
 class PlaylistWidget(QWidget):
     """
     Widget que muestra y gestiona la lista de reproducción.
@@ -175,16 +386,17 @@ class PlaylistWidget(QWidget):
         lista_reproduccion (ListaReproduccion): Lista de reproducción a mostrar.
         table_view (QTableView): Vista de tabla para mostrar las canciones.
         playlist_model (PlaylistModel): Modelo de datos para la tabla.
+        playlist_delegate (PlaylistDelegate): Delegado que dibuja las celdas.
         
     Signals:
         song_selected: Emitido cuando se selecciona una canción.
-        song_added: Emitido cuando se agrega una canción.
+        songs_added: Emitido una vez por lote con la lista de canciones agregadas.
         song_removed: Emitido cuando se elimina una canción.
     """
     
     # Definición de señales
     song_selected = pyqtSignal(object)  # Canción seleccionada
-    song_added = pyqtSignal(object)     # Canción agregada
+    songs_added = pyqtSignal(list)      # Lote de canciones agregadas
     song_removed = pyqtSignal(object)   # Canción eliminada
     
     def __init__(self, parent=None):
@@ -199,6 +411,20 @@ class PlaylistWidget(QWidget):
         # Inicializar la lista de reproducción
         self.lista_reproduccion = ListaReproduccion()
         
+        # Canciones en orden cronológico; se reconstruye solo al agregar o eliminar
+        self._canciones_cache = None
+        
+        # Señales de las tareas que leen metadatos en segundo plano; sin padre,
+        # para que sigan existiendo mientras una tarea las use (ver stop_imports)
+        self._metadata_signals = MetadataSignals()
+        
+        # Tareas de metadatos iniciadas aún sin terminar; se ejecutan de una
+        # en una, para que cada importación se agregue completa y en el orden
+        # en que se seleccionó (cada tarea ya lee sus archivos en paralelo)
+        self._metadata_pool = QThreadPool(self)
+        self._metadata_pool.setMaxThreadCount(1)
+        self._metadata_tasks = []
+        
         # Configurar la interfaz de usuario
         self._setup_ui()
         
@@ -225,6 +451,10 @@ class PlaylistWidget(QWidget):
         self.playlist_model = PlaylistModel()
         self.table_view.setModel(self.playlist_model)
         
+        # Delegado que dibuja cada celda con una sola consulta al modelo
+        self.playlist_delegate = PlaylistDelegate(self.table_view)
+        self.table_view.setItemDelegate(self.playlist_delegate)
+        
         # Crear los botones de control
         buttons_layout = QHBoxLayout()
         
@@ -257,6 +487,10 @@ class PlaylistWidget(QWidget):
         
         # Conectar selección de tabla
         self.table_view.doubleClicked.connect(self._on_table_double_clicked)
+        
+        # Conectar la lectura de metadatos en segundo plano
+        self._metadata_signals.batchReady.connect(self._on_metadata_batch)
+        self._metadata_signals.finished.connect(self._on_metadata_finished)
     
     def _on_add_clicked(self):
         """
@@ -271,77 +505,82 @@ class PlaylistWidget(QWidget):
             "Archivos de audio (*.mp3 *.wav *.ogg);;Todos los archivos (*)"
         )
         
-        # Procesar los archivos seleccionados
-        for file_path in files:
-            self._add_song_from_file(file_path)
-        
-        # Actualizar la vista
-        self._update_view()
+        # Leer los metadatos en un hilo secundario; las canciones se agregan
+        # por lotes a medida que llegan (ver _on_metadata_batch)
+        if files:
+            task = MetadataTask(files, self._metadata_signals)
+            self._metadata_tasks.append(task)
+            self._metadata_pool.start(task)
     
-    def _add_song_from_file(self, file_path):
+    def _on_metadata_batch(self, batch):
         """
-        Agrega una canción a la lista de reproducción desde un archivo.
+        Manejador para un lote de metadatos leídos en segundo plano.
+        Agrega las canciones a la lista de reproducción.
         
         Args:
-            file_path (str): Ruta al archivo de audio.
+            batch (list): Tuplas (titulo, artista, duracion, ruta).
         """
-        try:
-            # Obtener el nombre del archivo sin extensión como título
-            base_name = os.path.basename(file_path)
-            title = os.path.splitext(base_name)[0]
-            
-            # Intentar extraer metadatos si es un archivo MP3
-            artist = "Desconocido"
-            duration = 0
-            
-            if file_path.lower().endswith('.mp3'):
-                try:
-                    audio = MP3(file_path)
-                    duration = int(audio.info.length)
-                    
-                    # Intentar obtener metadatos
-                    if 'TPE1' in audio and audio['TPE1'].text[0]:
-                        artist = audio['TPE1'].text[0]
-                    if 'TIT2' in audio and audio['TIT2'].text[0]:
-                        title = audio['TIT2'].text[0]
-                except Exception as e:
-                    print(f"Error al leer metadatos MP3: {e}")
-            
-            # Agregar la canción a la lista de reproducción, siempre al final para mantener orden cronológico
-            nodo = self.lista_reproduccion.agregar_cancion(title, artist, duration, file_path)
-            
-            # Emitir señal de canción agregada
-            self.song_added.emit(nodo)
-            
-            return nodo
-        
-        except Exception as e:
-            QMessageBox.warning(
-                self,
-                "Error al agregar canción",
-                f"No se pudo agregar la canción: {str(e)}"
-            )
-            return None
+        # Agregar las canciones al final de la lista, manteniendo el orden cronológico
+        nodos = self.lista_reproduccion.agregar_canciones(batch)
+        self._canciones_cache = None
+        if not nodos:
+            return
+        
+        # Actualizar la vista una sola vez para todo el lote
+        self._rebuild_view()
+        
+        # Emitir la señal cuando el modelo ya contiene las canciones
+        self.songs_added.emit(nodos)
+    
+    def _on_metadata_finished(self):
+        """
+        Manejador para el fin de una tarea de lectura de metadatos.
+        """
+        # Las tareas terminan en el orden en que se iniciaron
+        if self._metadata_tasks:
+            self._metadata_tasks.pop(0)
+        
+        # Guardar en disco los metadatos leídos
+        metadata_cache.flush()
+    
+    def stop_imports(self):
+        """
+        Detiene las lecturas de metadatos en curso y guarda la caché.
+        
+        Las tareas terminan el lote que están leyendo y no emiten nada más.
+        Debe llamarse antes de cerrar la ventana.
+        """
+        for task in self._metadata_tasks:
+            task.cancel()
+        self._metadata_tasks.clear()
+        
+        # Descartar las tareas que aún no empezaron y esperar a la actual
+        self._metadata_pool.clear()
+        self._metadata_pool.waitForDone()
+        
+        # Guardar los metadatos leídos hasta ahora
+        metadata_cache.flush()
     
     def _on_remove_clicked(self):
         """
         Manejador para el evento de clic en el botón Eliminar.
         Elimina la canción seleccionada de la lista de reproducción.
         """
-        # Obtener el índice seleccionado
-        indexes = self.table_view.selectedIndexes()
-        if not indexes:
+        # Obtener la fila seleccionada directamente del rango de selección,
+        # sin crear un índice por cada celda seleccionada
+        selection = self.table_view.selectionModel().selection()
+        if selection.isEmpty():
             return
         
-        # Obtener la fila seleccionada (todos los índices de la misma fila)
-        row = indexes[0].row()
+        # Selección simple por filas: un único rango de una fila
+        row = selection[0].top()
         
         # Verificar si hay canciones en la lista
         if self.lista_reproduccion.esta_vacia():
             return
         
         # Buscar el nodo correspondiente a la fila seleccionada
-        canciones = self.lista_reproduccion.obtener_todas_las_canciones()
+        canciones = self._get_canciones()
         if row < len(canciones):
             # Obtener el nodo a eliminar
             nodo_a_eliminar = canciones[row]
@@ -350,32 +589,31 @@ class PlaylistWidget(QWidget):
             nodo_actual_temp = self.lista_reproduccion.obtener_cancion_actual()
             
             # Si el nodo a eliminar es el actual, simplemente eliminarlo
-            if nodo_a_eliminar == self.lista_reproduccion.obtener_cancion_actual():
+            if nodo_a_eliminar is self.lista_reproduccion.obtener_cancion_actual():
                 nodo_eliminado = self.lista_reproduccion.eliminar_cancion_actual()
+                self._canciones_cache = None
                 
                 # Emitir señal de canción eliminada
                 if nodo_eliminado:
                     self.song_removed.emit(nodo_eliminado)
             else:
                 # Hacer que el nodo a eliminar sea el actual y eliminarlo
-                while self.lista_reproduccion.obtener_cancion_actual() != nodo_a_eliminar:
-                    self.lista_reproduccion.siguiente_cancion()
+                self.lista_reproduccion.set_cancion_actual(nodo_a_eliminar)
                 
                 # Eliminar la canción y guardar el nodo eliminado
                 nodo_eliminado = self.lista_reproduccion.eliminar_cancion_actual()
+                self._canciones_cache = None
                 
                 # Restaurar el nodo actual si todavía existe y no era el eliminado
-                if not self.lista_reproduccion.esta_vacia() and nodo_actual_temp != nodo_eliminado:
-                    # Navegar hasta encontrar el nodo actual original
-                    while self.lista_reproduccion.obtener_cancion_actual() != nodo_actual_temp:
-                        self.lista_reproduccion.siguiente_cancion()
+                if not self.lista_reproduccion.esta_vacia() and nodo_actual_temp is not nodo_eliminado:
+                    self.lista_reproduccion.set_cancion_actual(nodo_actual_temp)
                 
                 # Emitir señal de canción eliminada
                 if nodo_eliminado:
                     self.song_removed.emit(nodo_eliminado)
         
         # Actualizar la vista
-        self._update_view()
+        self._rebuild_view()
     
     def _on_table_double_clicked(self, index):
         """
@@ -393,42 +631,61 @@ class PlaylistWidget(QWidget):
             return
         
         # Buscar el nodo correspondiente a la fila seleccionada
-        canciones = self.lista_reproduccion.obtener_todas_las_canciones()
+        canciones = self._get_canciones()
         if row < len(canciones):
             # Obtener el nodo seleccionado
             nodo_seleccionado = canciones[row]
             
             # Hacer que este nodo sea el actual
-            if nodo_seleccionado != self.lista_reproduccion.obtener_cancion_actual():
-                # Si la lista está en orden cronológico, podemos navegar en cualquier dirección
-                # para llegar al nodo deseado de la manera más eficiente
-                nodo_actual = self.lista_reproduccion.obtener_cancion_actual()
-                
-                # Si no hay un nodo actual (poco probable), solo establecemos el primero
-                if nodo_actual is None:
-                    return
-                
-                # Buscar y hacer actual la canción seleccionada navegando de forma eficiente
-                while self.lista_reproduccion.obtener_cancion_actual() != nodo_seleccionado:
-                    self.lista_reproduccion.siguiente_cancion()
+            if nodo_seleccionado is not self.lista_reproduccion.obtener_cancion_actual():
+                # Apuntar directamente al nodo, sin recorrer la lista
+                self.lista_reproduccion.set_cancion_actual(nodo_seleccionado)
                 
                 # Actualizar la canción actual en el modelo
-                self.playlist_model.set_cancion_actual(nodo_seleccionado)
+                self._refresh_current()
             
             # Emitir señal de canción seleccionada
             self.song_selected.emit(self.lista_reproduccion.obtener_cancion_actual())
     
-    def _update_view(self):
+    def _get_canciones(self):
+        """
+        Obtiene las canciones de la lista en orden cronológico.
+        
+        La lista se reconstruye solo después de agregar o eliminar canciones;
+        avanzar o retroceder no cambia el orden. No debe modificarse, ya que
+        también la usa el modelo de la tabla.
+        
+        Returns:
+            list: Lista de objetos NodoCancion.
+        """
+        if self._canciones_cache is None:
+            self._canciones_cache = self.lista_reproduccion.obtener_todas_las_canciones()
+        
+        return self._canciones_cache
+    
+    def _rebuild_view(self):
         """
-        Actualiza la vista de la tabla con los datos actuales.
+        Reconstruye la vista de la tabla con los datos actuales.
+        
+        Reinicia el modelo completo, por lo que solo debe usarse cuando
+        cambian las canciones de la lista (al agregar o eliminar).
         """
         # Obtener todas las canciones
-        canciones = self.lista_reproduccion.obtener_todas_las_canciones()
+        canciones = self._get_canciones()
         
         # Actualizar el modelo
         self.playlist_model.update_canciones(canciones)
         
         # Mantener la referencia a la canción actual
+        self._refresh_current()
+    
+    def _refresh_current(self):
+        """
+        Resalta en la tabla la canción actual de la lista.
+        
+        Solo se notifican las filas de la canción anterior y la nueva, de
+        modo que la selección y el desplazamiento de la tabla se conservan.
+        """
         cancion_actual = self.lista_reproduccion.obtener_cancion_actual()
         if cancion_actual:
             self.playlist_model.set_cancion_actual(cancion_actual)
@@ -442,6 +699,24 @@ class PlaylistWidget(QWidget):
         """
         return self.lista_reproduccion.obtener_cancion_actual()
     
+    def peek_next_song(self):
+        """
+        Obtiene la siguiente canción de la lista sin cambiar la canción actual.
+        
+        Returns:
+            NodoCancion: El nodo de la siguiente canción, o None si la lista está vacía.
+        """
+        return self.lista_reproduccion.obtener_siguiente_cancion()
+    
+    def peek_prev_song(self):
+        """
+        Obtiene la canción anterior de la lista sin cambiar la canción actual.
+        
+        Returns:
+            NodoCancion: El nodo de la canción anterior, o None si la lista está vacía.
+        """
+        return self.lista_reproduccion.obtener_anterior_cancion()
+    
     def next_song(self):
         """
         Avanza a la siguiente canción en la lista.
@@ -452,8 +727,7 @@ class PlaylistWidget(QWidget):
         nodo = self.lista_reproduccion.siguiente_cancion()
         if nodo:
             # Actualizar el modelo para resaltar la nueva canción actual
-            self.playlist_model.set_cancion_actual(nodo)
-        self._update_view()
+            self._refresh_current()
         return nodo
     
     def cancion_anterior(self):
@@ -466,8 +740,7 @@ class PlaylistWidget(QWidget):
         nodo = self.lista_reproduccion.cancion_anterior()
         if nodo:
             # Actualizar el modelo para resaltar la nueva canción actual
-            self.playlist_model.set_cancion_actual(nodo)
-        self._update_view()
+            self._refresh_current()
         return nodo
     
     def set_current_song(self, nodo_cancion):
@@ -477,6 +750,5 @@ class PlaylistWidget(QWidget):
         Args:
             nodo_cancion (NodoCancion): El nodo de la canción a establecer como actual.
         """
-        if nodo_cancion:
-            self.playlist_model.set_cancion_actual(nodo_cancion)
-            self._update_view() 
\ No newline at end of file
+        if self.lista_reproduccion.set_cancion_actual(nodo_cancion):
+            self._refresh_current()